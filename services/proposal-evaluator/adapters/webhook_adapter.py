@@ -456,11 +456,15 @@ def start_webhook_server(host: str = "0.0.0.0", port: int = 8000):
     """Start the webhook server"""
     logger.info(f"Starting Agentius Webhook Adapter on {host}:{port}")
     
+    # The orchestrator fans each emit out to many short handlers, which is
+    # scheduling-bound work where uvloop beats the default selector loop;
+    # uvicorn's "auto" picks it up when installed
     uvicorn.run(
         app,
         host=host,
         port=port,
-        log_level="info"
+        log_level="info",
+        loop="auto"
     )
 
 if __name__ == "__main__":
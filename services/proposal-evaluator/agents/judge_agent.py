@@ -3,6 +3,7 @@ JudgeAgent - Evaluates proposals from CFO/CMO/CEO perspectives
 """
 
 import asyncio
+import weakref
 from typing import List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime
@@ -12,6 +13,26 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Judge (LLM) calls in flight at once, shared by every judge caller in the
+# process; semaphores are per event loop since one can't cross loops
+DEFAULT_MAX_PARALLEL_JUDGES = 6
+_max_parallel_judges = DEFAULT_MAX_PARALLEL_JUDGES
+_judge_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def set_max_parallel_judges(limit: int):
+    """Set the cap on concurrent judge calls (calls already holding a slot finish under the old one)"""
+    global _max_parallel_judges
+    _max_parallel_judges = limit
+    _judge_slots.clear()
+
+def judge_slots() -> asyncio.Semaphore:
+    """Shared semaphore bounding concurrent judge calls on the running loop"""
+    loop = asyncio.get_running_loop()
+    slots = _judge_slots.get(loop)
+    if slots is None:
+        slots = _judge_slots[loop] = asyncio.Semaphore(_max_parallel_judges)
+    return slots
+
 @dataclass
 class JudgeEvaluation:
     """Evaluation from a judge perspective"""
@@ -42,6 +63,9 @@ class JudgeAgent:
         self.llm_client = LLMClient(config.get("llm", {}))
         self.version = "1.0.0"
         
+        if "max_parallel_judges" in config:
+            set_max_parallel_judges(config["max_parallel_judges"])
+        
         # Perspective-specific prompts
         self.perspective_prompts = self._load_perspective_prompts()
         
@@ -411,13 +435,13 @@ Consider all aspects: strategy, financials, market fit, execution, and risk."""
     ) -> List[JudgeEvaluation]:
         """Evaluate proposal from all three perspectives simultaneously"""
         
-        tasks = [
-            self.evaluate(proposal, context, "CFO"),
-            self.evaluate(proposal, context, "CMO"), 
-            self.evaluate(proposal, context, "CEO")
-        ]
+        async def evaluate(perspective: str) -> JudgeEvaluation:
+            async with judge_slots():
+                return await self.evaluate(proposal, context, perspective)
         
-        evaluations = await asyncio.gather(*tasks)
+        evaluations = await asyncio.gather(*(
+            evaluate(perspective) for perspective in ("CFO", "CMO", "CEO")
+        ))
         
         overall_score = sum(eval.score for eval in evaluations) / len(evaluations)
         logger.info(f"Overall evaluation score: {overall_score:.1f}/10")
@@ -6,14 +6,25 @@ Agentius Core Event System - Orchestrates autonomous agent reactions
 """
 
 import asyncio
-import json
+import contextvars
+import hashlib
+import inspect
+import itertools
+import logging
+import time
 import uuid
-from typing import Dict, Any, List, Callable, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from collections import ChainMap, Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Mapping, MutableMapping, Callable, Awaitable, Optional, Deque, Set, FrozenSet, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from enum import Enum
 
 from ..utils.logger import setup_logger
+from ..utils.serialization import dumps
+
+if TYPE_CHECKING:
+    from .state_backend import StateBackend
 
 logger = setup_logger(__name__)
 
@@ -34,24 +45,125 @@ class EventType(Enum):
     THRESHOLD_REACHED = "threshold_reached"
     MAX_ITERATIONS_REACHED = "max_iterations_reached"
 
-@dataclass
+# task_type -> its `<task_type>_started` event type, resolved once
+_STARTED_EVENT_TYPES: Dict[str, EventType] = {
+    member.value[:-len("_started")]: member
+    for member in EventType
+    if member.value.endswith("_started")
+}
+
+# Event ids are a per-process UUID prefix plus a counter: unique across
+# processes, but far cheaper than a fresh uuid4() per event
+_PROCESS_ID = uuid.uuid4().hex
+_id_counter = itertools.count()
+_now_ns = time.time_ns
+
+def _next_id() -> str:
+    """Generate a process-unique event id"""
+    return f"{_PROCESS_ID}-{next(_id_counter)}"
+
+# Judges score on a 0-10 scale; the evaluation passes at an average of 8
+SCORE_THRESHOLD = 8.0
+MAX_JUDGE_SCORE = 10.0
+
+def _meets_threshold(evaluations: List[Dict[str, Any]]) -> bool:
+    """
+    Check whether the average judge score reaches SCORE_THRESHOLD.
+    Stops reading scores as soon as the remaining judges could no
+    longer lift the average over the threshold.
+    """
+    n = len(evaluations)
+    required = SCORE_THRESHOLD * n
+    total = 0.0
+    remaining = n
+    for evaluation in evaluations:
+        total += evaluation["score"]
+        remaining -= 1
+        if total + remaining * MAX_JUDGE_SCORE < required:
+            return False
+    return total >= required
+
+_NO_EVENTS: FrozenSet[str] = frozenset()
+
+def _extend_payload(payload: Mapping[str, Any], **updates: Any) -> ChainMap:
+    """
+    Layer new keys over an event payload without copying it.
+    Existing chains are extended rather than nested so lookups stay one level deep.
+    """
+    if isinstance(payload, ChainMap):
+        return ChainMap(updates, *payload.maps)
+    return ChainMap(updates, payload)
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    """Wrap a non-coroutine awaitable (e.g. a future) so it can run as a task"""
+    return await awaitable
+
+# Events that close an evaluation context and release its bookkeeping;
+# the orchestrator's runs end on THRESHOLD_REACHED or MAX_ITERATIONS_REACHED
+_TERMINAL_EVENTS = frozenset({
+    EventType.EVALUATION_COMPLETE,
+    EventType.EVALUATION_FAILED,
+    EventType.THRESHOLD_REACHED,
+    EventType.MAX_ITERATIONS_REACHED,
+})
+
+# Events that are always recorded in history, even with nobody listening
+_PERSIST_EVENTS = _TERMINAL_EVENTS
+
+# Workflow hops raised and consumed by the orchestrator itself
+_INTERNAL_EVENTS = frozenset({
+    EventType.JUDGE_READY,
+    EventType.CFO_EVALUATION_COMPLETE,
+    EventType.CMO_EVALUATION_COMPLETE,
+    EventType.CEO_EVALUATION_COMPLETE,
+    EventType.ALL_JUDGES_COMPLETE,
+    EventType.ITERATION_COMPLETE,
+})
+
+# Judge perspectives and the event each one completes with
+JUDGE_PERSPECTIVES = ("CFO", "CMO", "CEO")
+_JUDGE_COMPLETE_EVENTS = {
+    "CFO": EventType.CFO_EVALUATION_COMPLETE,
+    "CMO": EventType.CMO_EVALUATION_COMPLETE,
+    "CEO": EventType.CEO_EVALUATION_COMPLETE,
+}
+_JUDGE_EVENT_PERSPECTIVES = {event_type: perspective for perspective, event_type in _JUDGE_COMPLETE_EVENTS.items()}
+
+# Payload keys that make up a judge's verdict; only these are cached, never
+# the context-specific rest of the completion payload
+_JUDGE_RESULT_FIELDS = ("score", "objections", "suggestions", "strengths", "concerns")
+
+@dataclass(slots=True)
 class Event:
     """Core event structure"""
     id: str
     type: EventType
-    payload: Dict[str, Any]
+    payload: MutableMapping[str, Any]  # dict, or a ChainMap layered over a parent payload
     context_id: str  # Proposal evaluation session ID
     agent_id: Optional[str] = None
-    timestamp: datetime = None
+    timestamp_ns: Optional[int] = None  # Epoch nanoseconds (UTC)
     correlation_id: Optional[str] = None
+    _payload_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+        if self.timestamp_ns is None:
+            self.timestamp_ns = _now_ns()
         if self.id is None:
-            self.id = str(uuid.uuid4())
+            self.id = _next_id()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Event time as a naive UTC datetime"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, timezone.utc).replace(tzinfo=None)
+    
+    @property
+    def payload_bytes(self) -> bytes:
+        """Payload as JSON bytes, serialized once on first access"""
+        if self._payload_bytes is None:
+            self._payload_bytes = dumps(self.payload)
+        return self._payload_bytes
 
-@dataclass 
+@dataclass(slots=True)
 class TaskRegistration:
     """Persistent task registry entry"""
     id: str
@@ -60,12 +172,48 @@ class TaskRegistration:
     status: str  # pending, running, complete, failed
     agent_id: str
     depends_on: List[str]  # Event IDs this task depends on
-    payload: Dict[str, Any]
+    payload: MutableMapping[str, Any]
     created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    _deps: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Hashed once so readiness checks are a single subset test
+        self._deps = frozenset(self.depends_on)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize without asdict's reflection; payload/result are shared, not copied"""
+        return {
+            "id": self.id,
+            "context_id": self.context_id,
+            "task_type": self.task_type,
+            "status": self.status,
+            "agent_id": self.agent_id,
+            "depends_on": list(self.depends_on),
+            "payload": self.payload,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "result": self.result,
+            "error": self.error
+        }
+
+@dataclass(slots=True)
+class _Dispatch:
+    """An emit call that is draining its own queue of nested events"""
+    bus: "EventBus"
+    pending: Deque[Event]
+    draining: bool = True
+
+# The dispatch the current task is running handlers for, if any. Handlers
+# (and the tasks they spawn) inherit it, so their emits can be told apart
+# from emits of unrelated tasks
+_current_dispatch: contextvars.ContextVar[Optional[_Dispatch]] = contextvars.ContextVar(
+    "event_bus_dispatch", default=None
+)
 
 class EventBus:
     """
@@ -73,64 +221,253 @@ class EventBus:
     Manages autonomous agent reactions and task scheduling
     """
     
-    def __init__(self):
-        self.subscribers: Dict[EventType, List[Callable]] = {}
-        self.event_history: List[Event] = []
+    def __init__(
+        self,
+        history_max: int = 10_000,
+        context_history_max: int = 1_000,
+        backend: Optional["StateBackend"] = None
+    ):
+        self.subscribers: Dict[EventType, Tuple[Callable, ...]] = {}
+        self.event_history: Deque[Event] = deque(maxlen=history_max)
         self.task_registry: Dict[str, TaskRegistration] = {}
+        self._tasks_by_context: Dict[str, Dict[str, TaskRegistration]] = defaultdict(dict)
+        self._waiters: Dict[str, Set[str]] = defaultdict(set)  # event id -> waiting task ids
         self.active_contexts: Dict[str, Dict[str, Any]] = {}
         
+        # Per-context event ring and id set, so lookups never scan global history
+        self._context_history_max = context_history_max
+        self._context_events: Dict[str, Deque[Event]] = {}
+        self._context_event_ids: Dict[str, Set[str]] = {}
+        
+        # Optional durable storage; writes run on a single worker thread so
+        # they stay ordered and off the event loop
+        self.backend = backend
+        self._persist_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-persist")
+            if backend is not None else None
+        )
+        
+    def _persist(self, write: Callable, item: Any):
+        """Schedule a backend write without waiting for it"""
+        future = asyncio.get_running_loop().run_in_executor(self._persist_executor, write, item)
+        future.add_done_callback(self._log_persist_failure)
+    
+    def _persist_event(self, event: Event):
+        """Queue an event write"""
+        # Serialize the payload now, on the loop, so the writer thread never
+        # reads a payload the workflow is still changing
+        _ = event.payload_bytes
+        self._persist(self.backend.append_event, event)
+    
+    def _persist_task(self, task: TaskRegistration):
+        """Queue a write of the task's current state as a detached snapshot"""
+        snapshot = replace(
+            task,
+            depends_on=list(task.depends_on),
+            payload=dict(task.payload),
+            result=dict(task.result) if task.result is not None else None
+        )
+        self._persist(self.backend.put_task, snapshot)
+    
+    async def aclose(self):
+        """Flush pending backend writes and close the backend"""
+        if self._persist_executor is None:
+            return
+        
+        await asyncio.to_thread(self._persist_executor.shutdown, wait=True)
+        self._persist_executor = None
+        close = getattr(self.backend, "close", None)
+        if close is not None:
+            close()
+    
+    @staticmethod
+    def _log_persist_failure(future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"State backend write failed: {future.exception()}")
+    
     async def emit(self, event: Event):
-        """Emit an event to all subscribers"""
-        logger.info(f"Emitting event: {event.type.value} for context {event.context_id}")
+        """
+        Emit an event to all subscribers.
+        Events emitted from inside a handler of this bus are queued and
+        drained by the outer emit instead of recursing into dispatch; any
+        other emit dispatches its event before returning.
+        """
+        active = _current_dispatch.get()
+        if active is not None and active.bus is self and active.draining:
+            active.pending.append(event)
+            return
         
-        # Store in history
-        self.event_history.append(event)
+        dispatch = _Dispatch(self, deque((event,)))
+        token = _current_dispatch.set(dispatch)
+        try:
+            while dispatch.pending:
+                await self._dispatch(dispatch.pending.popleft())
+        finally:
+            # Late emits from tasks spawned by a handler dispatch on their own
+            dispatch.draining = False
+            _current_dispatch.reset(token)
+    
+    def record(self, event: Event):
+        """
+        Log an event against its context without dispatching it.
+        Tasks depending on the event become ready on their next readiness check.
+        """
+        if self.backend is not None:
+            self._persist_event(event)
         
         # Update context
         if event.context_id not in self.active_contexts:
+            self._context_events[event.context_id] = deque(maxlen=self._context_history_max)
+            self._context_event_ids[event.context_id] = set()
             self.active_contexts[event.context_id] = {
-                "events": [],
+                "events": self._context_events[event.context_id],
                 "tasks": [],
                 "state": "active",
                 "created_at": event.timestamp
             }
         
-        self.active_contexts[event.context_id]["events"].append(event)
+        self._context_events[event.context_id].append(event)
+        self._context_event_ids[event.context_id].add(event.id)
+    
+    async def _dispatch(self, event: Event):
+        """Record an event and run its subscribers and dependent tasks"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Emitting event: {event.type.value} for context {event.context_id}")
+        
+        self.record(event)
+        
+        # Fast path: bookkeeping-only events nobody listens or waits for
+        handlers = self.subscribers.get(event.type, ())
+        if not handlers and event.id not in self._waiters and event.type not in _PERSIST_EVENTS:
+            return
+        
+        # Store in history
+        self.event_history.append(event)
         
         # Notify subscribers
-        if event.type in self.subscribers:
-            tasks = []
-            for handler in self.subscribers[event.type]:
-                task = asyncio.create_task(handler(event))
-                tasks.append(task)
+        if len(handlers) == 1:
+            await self._invoke_handler(handlers[0], event)
+        elif handlers:
+            # Judge by the result, not the handler: a partial or other sync
+            # wrapper around an async def still hands back a coroutine
+            pending = []
+            for handler in handlers:
+                try:
+                    result = handler(event)
+                except Exception as e:
+                    logger.error(f"Handler for {event.type.value} failed: {e}")
+                    continue
+                if inspect.isawaitable(result):
+                    pending.append(result)
             
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+            if pending:
+                # A failing handler cancels its siblings and is logged, rather
+                # than disappearing into a gather result list
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        for awaitable in pending:
+                            tg.create_task(awaitable if asyncio.iscoroutine(awaitable) else _await(awaitable))
+                except* Exception as eg:
+                    for exc in eg.exceptions:
+                        logger.error(
+                            f"Handler for {event.type.value} failed: {exc}",
+                            exc_info=exc
+                        )
         
         # Check for task completions
         await self._process_dependent_tasks(event)
+        
+        # Free per-context state once the evaluation has finished
+        if event.type in _TERMINAL_EVENTS:
+            self._release_context(event.context_id)
+    
+    def _release_context(self, context_id: str):
+        """Drop all per-context bookkeeping for a finished evaluation"""
+        self.active_contexts.pop(context_id, None)
+        self._context_events.pop(context_id, None)
+        self._context_event_ids.pop(context_id, None)
+        
+        # Tasks still pending will never run; stop waiting on their events
+        for task_id, task in self._tasks_by_context.pop(context_id, {}).items():
+            if task.status == "pending":
+                self._discard_waiters(task)
+            self.task_registry.pop(task_id, None)
+        
+        logger.debug(f"Released context {context_id}")
+    
+    async def _invoke_handler(self, handler: Callable, event: Event):
+        """Run a lone subscriber inline, without task/gather plumbing"""
+        try:
+            result = handler(event)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Handler for {event.type.value} failed: {e}")
     
     def subscribe(self, event_type: EventType, handler: Callable):
         """Subscribe to an event type"""
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        self.subscribers[event_type].append(handler)
+        # Stored as tuples so emit iterates an immutable snapshot
+        self.subscribers[event_type] = (*self.subscribers.get(event_type, ()), handler)
         
         logger.debug(f"Subscribed handler to {event_type.value}")
     
-    async def register_task(self, task: TaskRegistration):
-        """Register a task in the persistent registry"""
+    def _index_task(self, task: TaskRegistration):
+        """Add a task to the registry, its context and the waiter index"""
         self.task_registry[task.id] = task
+        self._tasks_by_context[task.context_id][task.id] = task
+        if self.backend is not None:
+            self._persist_task(task)
         
         # Add to context
         if task.context_id in self.active_contexts:
             self.active_contexts[task.context_id]["tasks"].append(task.id)
         
+        self._add_waiters(task)
+    
+    def _add_waiters(self, task: TaskRegistration):
+        """Index a pending task under each dependency that has not fired yet"""
+        if task.status != "pending":
+            return
+        
+        context_events = self._context_event_ids.get(task.context_id, _NO_EVENTS)
+        for dep_id in task._deps - context_events:
+            self._waiters[dep_id].add(task.id)
+    
+    def _discard_waiters(self, task: TaskRegistration):
+        """Remove a task from the waiter index"""
+        for dep_id in task._deps:
+            waiting = self._waiters.get(dep_id)
+            if waiting is not None:
+                waiting.discard(task.id)
+                if not waiting:
+                    del self._waiters[dep_id]
+    
+    async def register_task(self, task: TaskRegistration):
+        """Register a task in the persistent registry"""
+        self._index_task(task)
+        
         logger.info(f"Registered task {task.id} for context {task.context_id}")
         
         # Check if task can run immediately
         await self._check_task_readiness(task.id)
     
+    async def register_tasks(self, tasks: List[TaskRegistration]):
+        """Register sibling tasks in one pass and start the ready ones together"""
+        for task in tasks:
+            self._index_task(task)
+        
+        logger.info(f"Registered {len(tasks)} tasks: {', '.join(t.id for t in tasks)}")
+        
+        ready_ids = []
+        for task in tasks:
+            context_events = self._context_event_ids.get(task.context_id, _NO_EVENTS)
+            if task.status == "pending" and task._deps <= context_events:
+                self._discard_waiters(task)
+                ready_ids.append(task.id)
+        
+        if ready_ids:
+            await asyncio.gather(*(self._execute_task(task_id) for task_id in ready_ids))
+    
     async def _check_task_readiness(self, task_id: str):
         """Check if a task's dependencies are met"""
         task = self.task_registry.get(task_id)
@@ -138,67 +475,123 @@ class EventBus:
             return
         
         # Check dependencies
-        context_events = [e.id for e in self.event_history if e.context_id == task.context_id]
-        dependencies_met = all(dep_id in context_events for dep_id in task.depends_on)
+        context_events = self._context_event_ids.get(task.context_id, _NO_EVENTS)
+        dependencies_met = task._deps <= context_events
         
         if dependencies_met:
+            self._discard_waiters(task)
             await self._execute_task(task_id)
     
     async def _process_dependent_tasks(self, event: Event):
         """Process tasks that depend on this event"""
-        for task_id, task in self.task_registry.items():
-            if (task.status == "pending" and 
-                event.context_id == task.context_id and 
-                event.id in task.depends_on):
-                await self._check_task_readiness(task_id)
+        for task_id in self._waiters.pop(event.id, ()):
+            await self._check_task_readiness(task_id)
     
     async def _execute_task(self, task_id: str):
         """Execute a ready task"""
         task = self.task_registry[task_id]
         task.status = "running"
         task.started_at = datetime.utcnow()
+        if self.backend is not None:
+            self._persist_task(task)
         
         logger.info(f"Executing task {task_id}: {task.task_type}")
         
+        started_type = _STARTED_EVENT_TYPES.get(task.task_type)
+        if started_type is None:
+            self._fail_task(task, f"Unknown task type: {task.task_type}")
+            return
+        
         try:
             # Task execution would be handled by specific agent handlers
             # This is a placeholder for the execution framework
             await self.emit(Event(
-                id=str(uuid.uuid4()),
-                type=EventType(f"{task.task_type}_started"),
+                id=_next_id(),
+                type=started_type,
                 payload=task.payload,
                 context_id=task.context_id,
                 agent_id=task.agent_id
             ))
             
         except Exception as e:
-            task.status = "failed"
-            task.error = str(e)
-            task.completed_at = datetime.utcnow()
-            logger.error(f"Task {task_id} failed: {e}")
+            self._fail_task(task, str(e))
+    
+    def _fail_task(self, task: TaskRegistration, error: str):
+        """Mark a task failed and record the error"""
+        task.status = "failed"
+        task.error = error
+        task.completed_at = datetime.utcnow()
+        logger.error(f"Task {task.id} failed: {error}")
+        
+        if self.backend is not None:
+            self._persist_task(task)
     
     def get_context_state(self, context_id: str) -> Dict[str, Any]:
         """Get the current state of an evaluation context"""
         return self.active_contexts.get(context_id, {})
     
-    def get_event_chain(self, context_id: str) -> List[Event]:
+    async def get_event_chain(self, context_id: str) -> List[Event]:
         """Get the event chain for a context"""
-        return [e for e in self.event_history if e.context_id == context_id]
+        if context_id in self._context_events:
+            return list(self._context_events[context_id])
+        
+        # Released or pre-restart contexts are served from the backend log
+        if self.backend is not None:
+            events, _ = await asyncio.to_thread(self.backend.load_context, context_id)
+            return events
+        
+        return []
     
-    def get_task_status(self, context_id: str) -> Dict[str, Any]:
-        """Get task status for a context"""
-        context_tasks = [
-            task for task in self.task_registry.values() 
-            if task.context_id == context_id
-        ]
+    async def restore_context(self, context_id: str) -> bool:
+        """Reload a context's tasks and event log from the backend into memory"""
+        if self.backend is None:
+            return False
+        
+        events, tasks = await asyncio.to_thread(self.backend.load_context, context_id)
+        if not events and not tasks:
+            return False
+        
+        context_events = deque(events, maxlen=self._context_history_max)
+        self._context_events[context_id] = context_events
+        self._context_event_ids[context_id] = {e.id for e in events}
+        self.active_contexts[context_id] = {
+            "events": context_events,
+            "tasks": [t.id for t in tasks],
+            "state": "active",
+            "created_at": events[0].timestamp if events else tasks[0].created_at
+        }
+        
+        for task in tasks:
+            self.task_registry[task.id] = task
+            self._tasks_by_context[context_id][task.id] = task
+            self._add_waiters(task)
+        
+        logger.info(f"Restored context {context_id}: {len(events)} events, {len(tasks)} tasks")
+        return True
+    
+    def get_task_counts(self, context_id: str) -> Dict[str, int]:
+        """Get task counts by status for a context"""
+        context_tasks = self._tasks_by_context.get(context_id, {})
+        counts = Counter(t.status for t in context_tasks.values())
         
         return {
             "total": len(context_tasks),
-            "pending": len([t for t in context_tasks if t.status == "pending"]),
-            "running": len([t for t in context_tasks if t.status == "running"]),
-            "complete": len([t for t in context_tasks if t.status == "complete"]),
-            "failed": len([t for t in context_tasks if t.status == "failed"]),
-            "tasks": [asdict(t) for t in context_tasks]
+            "pending": counts["pending"],
+            "running": counts["running"],
+            "complete": counts["complete"],
+            "failed": counts["failed"]
+        }
+    
+    def get_task_details(self, context_id: str) -> List[Dict[str, Any]]:
+        """Get serialized task entries for a context"""
+        context_tasks = self._tasks_by_context.get(context_id, {})
+        return [t.to_dict() for t in context_tasks.values()]
+    
+    def get_task_status(self, context_id: str) -> Dict[str, Any]:
+        """Get task status for a context"""
+        return {
+            **self.get_task_counts(context_id),
+            "tasks": self.get_task_details(context_id)
         }
 
 class AgentiusOrchestrator:
@@ -207,42 +600,61 @@ class AgentiusOrchestrator:
     Manages the complete event-driven workflow
     """
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, judge_cache_size: int = 2048):
         self.event_bus = event_bus
+        
+        # (perspective, proposal hash) -> judge verdict fields, LRU-bounded
+        self._judge_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._judge_cache_size = judge_cache_size
+        
+        # context_id -> perspective -> evaluation payload for the current round
+        self._judge_results: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        
         self._setup_workflow_handlers()
     
     def _setup_workflow_handlers(self):
         """Set up the core workflow event handlers"""
         
-        # Proposal submission starts the workflow
-        self.event_bus.subscribe(
-            EventType.PROPOSAL_SUBMITTED, 
-            self._handle_proposal_submitted
-        )
-        
-        # Builder completion triggers judge readiness
-        self.event_bus.subscribe(
-            EventType.BUILDER_COMPLETE,
-            self._handle_builder_complete
-        )
-        
-        # All judges complete triggers refiner readiness
-        self.event_bus.subscribe(
-            EventType.ALL_JUDGES_COMPLETE,
-            self._handle_all_judges_complete
-        )
+        # The workflow is a fixed DAG; keep it as a transition table so
+        # internal hops can be dispatched directly (see _advance)
+        self._transitions: Dict[EventType, Callable] = {
+            # Proposal submission starts the workflow
+            EventType.PROPOSAL_SUBMITTED: self._handle_proposal_submitted,
+            # Builder completion triggers judge readiness
+            EventType.BUILDER_COMPLETE: self._handle_builder_complete,
+            # Refined proposals go back through the same judge fan-out
+            EventType.JUDGE_READY: self._handle_builder_complete,
+            # Individual judge results are collected into ALL_JUDGES_COMPLETE
+            **{
+                event_type: self._handle_judge_evaluation_complete
+                for event_type in _JUDGE_COMPLETE_EVENTS.values()
+            },
+            # All judges complete triggers refiner readiness
+            EventType.ALL_JUDGES_COMPLETE: self._handle_all_judges_complete,
+            # Refiner completion triggers iteration check
+            EventType.REFINER_COMPLETE: self._handle_refiner_complete,
+            # Iteration completion triggers next cycle or termination
+            EventType.ITERATION_COMPLETE: self._handle_iteration_complete,
+        }
         
-        # Refiner completion triggers iteration check
-        self.event_bus.subscribe(
-            EventType.REFINER_COMPLETE,
-            self._handle_refiner_complete
-        )
+        for event_type, handler in self._transitions.items():
+            self.event_bus.subscribe(event_type, handler)
+    
+    async def _advance(self, event: Event):
+        """
+        Move the workflow on with an event raised by the orchestrator.
+        Internal hops that only the orchestrator listens to are recorded and
+        handled directly, skipping history and subscriber dispatch; anything
+        observable goes through the event bus.
+        """
+        if event.type in _INTERNAL_EVENTS:
+            handler = self._transitions[event.type]
+            if self.event_bus.subscribers.get(event.type) == (handler,):
+                self.event_bus.record(event)
+                await handler(event)
+                return
         
-        # Iteration completion triggers next cycle or termination
-        self.event_bus.subscribe(
-            EventType.ITERATION_COMPLETE,
-            self._handle_iteration_complete
-        )
+        await self.event_bus.emit(event)
     
     async def _handle_proposal_submitted(self, event: Event):
         """Handle new proposal submission"""
@@ -266,38 +678,125 @@ class AgentiusOrchestrator:
         """Handle builder completion"""
         proposal_text = event.payload.get("proposal_text")
         
+        # Reuse evaluations of an identical proposal text instead of re-judging
+        judge_perspectives = []
+        for perspective in JUDGE_PERSPECTIVES:
+            cached = self._get_cached_evaluation(perspective, proposal_text)
+            if cached is None:
+                judge_perspectives.append(perspective)
+                continue
+            
+            logger.info(f"Reusing cached {perspective} evaluation for context {event.context_id}")
+            await self._advance(Event(
+                id=_next_id(),
+                type=_JUDGE_COMPLETE_EVENTS[perspective],
+                payload=_extend_payload(
+                    event.payload,
+                    perspective=perspective,
+                    proposal_text=proposal_text,
+                    cached=True,
+                    **cached
+                ),
+                context_id=event.context_id,
+                agent_id=f"judge_{perspective.lower()}_agent"
+            ))
+        
+        if not judge_perspectives:
+            return
+        
         # Register judge tasks (parallel execution)
-        judge_perspectives = ["CFO", "CMO", "CEO"]
+        created_at = datetime.utcnow()
         
-        for perspective in judge_perspectives:
-            judge_task = TaskRegistration(
+        judge_tasks = [
+            TaskRegistration(
                 id=f"judge_{perspective}_{event.context_id}",
                 context_id=event.context_id,
                 task_type=f"judge_{perspective.lower()}",
                 status="pending",
                 agent_id=f"judge_{perspective.lower()}_agent",
                 depends_on=[event.id],
-                payload={
-                    **event.payload,
-                    "perspective": perspective,
-                    "proposal_text": proposal_text
-                },
-                created_at=datetime.utcnow()
+                payload=_extend_payload(
+                    event.payload,
+                    perspective=perspective,
+                    proposal_text=proposal_text
+                ),
+                created_at=created_at
             )
-            
-            await self.event_bus.register_task(judge_task)
+            for perspective in judge_perspectives
+        ]
+        
+        await self.event_bus.register_tasks(judge_tasks)
+    
+    @staticmethod
+    def _judge_cache_key(perspective: str, proposal_text: str) -> Tuple[str, str]:
+        digest = hashlib.blake2b(proposal_text.encode(), digest_size=16).hexdigest()
+        return perspective, digest
+    
+    def _get_cached_evaluation(self, perspective: str, proposal_text: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Look up a previous evaluation of this exact proposal text"""
+        if not proposal_text:
+            return None
+        
+        key = self._judge_cache_key(perspective, proposal_text)
+        cached = self._judge_cache.get(key)
+        if cached is not None:
+            self._judge_cache.move_to_end(key)
+        return cached
+    
+    async def _handle_judge_evaluation_complete(self, event: Event):
+        """Collect a judge's evaluation and fire ALL_JUDGES_COMPLETE once every judge reported"""
+        perspective = _JUDGE_EVENT_PERSPECTIVES[event.type]
+        proposal_text = event.payload.get("proposal_text")
+        
+        # Cache the verdict for reuse on identical proposal text
+        if proposal_text and not event.payload.get("cached"):
+            key = self._judge_cache_key(perspective, proposal_text)
+            self._judge_cache[key] = {
+                name: event.payload[name] for name in _JUDGE_RESULT_FIELDS if name in event.payload
+            }
+            self._judge_cache.move_to_end(key)
+            if len(self._judge_cache) > self._judge_cache_size:
+                self._judge_cache.popitem(last=False)
+        
+        # Keyed by perspective so a repeated completion cannot be counted twice
+        results = self._judge_results[event.context_id]
+        results[perspective] = event.payload
+        if len(results) < len(JUDGE_PERSPECTIVES):
+            return
+        
+        del self._judge_results[event.context_id]
+        evaluations = [results[p] for p in JUDGE_PERSPECTIVES]
+        payload = dict(event.payload)
+        payload["evaluations"] = evaluations
+        payload.pop("perspective", None)
+        payload.pop("cached", None)
+        
+        await self._advance(Event(
+            id=_next_id(),
+            type=EventType.ALL_JUDGES_COMPLETE,
+            payload=payload,
+            context_id=event.context_id
+        ))
     
     async def _handle_all_judges_complete(self, event: Event):
         """Handle completion of all judge evaluations"""
         evaluations = event.payload.get("evaluations", [])
         
-        # Check if refinement is needed
-        avg_score = sum(e["score"] for e in evaluations) / len(evaluations)
+        if not evaluations:
+            logger.error(f"No judge evaluations received for context {event.context_id}")
+            await self._advance(Event(
+                id=_next_id(),
+                type=EventType.EVALUATION_FAILED,
+                payload=_extend_payload(event.payload, error="No judge evaluations received"),
+                context_id=event.context_id
+            ))
+            return
         
-        if avg_score >= 8.0:
+        # Check if refinement is needed
+        if _meets_threshold(evaluations):
             # Threshold reached, complete evaluation
-            await self.event_bus.emit(Event(
-                id=str(uuid.uuid4()),
+            await self._advance(Event(
+                id=_next_id(),
                 type=EventType.THRESHOLD_REACHED,
                 payload=event.payload,
                 context_id=event.context_id
@@ -305,7 +804,7 @@ class AgentiusOrchestrator:
         else:
             # Register refiner task
             refiner_task = TaskRegistration(
-                id=f"refiner_{event.context_id}_{datetime.utcnow().timestamp()}",
+                id=f"refiner_{event.context_id}_{_now_ns()}",
                 context_id=event.context_id,
                 task_type="refine_proposal",
                 status="pending",
@@ -319,15 +818,13 @@ class AgentiusOrchestrator:
     
     async def _handle_refiner_complete(self, event: Event):
         """Handle refiner completion"""
-        iteration_count = event.payload.get("iteration_count", 0)
+        payload = dict(event.payload)
+        payload["iteration_count"] = payload.get("iteration_count", 0) + 1
         
-        await self.event_bus.emit(Event(
-            id=str(uuid.uuid4()),
+        await self._advance(Event(
+            id=_next_id(),
             type=EventType.ITERATION_COMPLETE,
-            payload={
-                **event.payload,
-                "iteration_count": iteration_count + 1
-            },
+            payload=payload,
             context_id=event.context_id
         ))
     
@@ -337,8 +834,8 @@ class AgentiusOrchestrator:
         max_iterations = event.payload.get("max_iterations", 5)
         
         if iteration_count >= max_iterations:
-            await self.event_bus.emit(Event(
-                id=str(uuid.uuid4()),
+            await self._advance(Event(
+                id=_next_id(),
                 type=EventType.MAX_ITERATIONS_REACHED,
                 payload=event.payload,
                 context_id=event.context_id
@@ -347,13 +844,10 @@ class AgentiusOrchestrator:
             # Continue with next iteration - trigger judges again
             refined_proposal = event.payload.get("refined_proposal")
             
-            await self.event_bus.emit(Event(
-                id=str(uuid.uuid4()),
+            await self._advance(Event(
+                id=_next_id(),
                 type=EventType.JUDGE_READY,
-                payload={
-                    **event.payload,
-                    "proposal_text": refined_proposal
-                },
+                payload=_extend_payload(event.payload, proposal_text=refined_proposal),
                 context_id=event.context_id
             ))
 
@@ -7,21 +7,69 @@ to generate training data and improve without risk.
 """
 
 import asyncio
+import itertools
 import json
-from typing import Dict, Any, List, Optional, Tuple
+import math
+import os
+import re
+import time
+import weakref
+from array import array
+from collections import Counter, defaultdict, deque
+from statistics import fmean, pvariance
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Any, Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 import hashlib
 
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
 from .decision_tracer import global_tracer, DecisionType
-from .training_engine import TrainingExample, training_orchestrator
-from ..agents.specialized_judges import JudgeFactory
+from . import training_engine
+from .training_engine import TrainingExample
+from ..agents.judge_agent import judge_slots, set_max_parallel_judges
+from ..agents.specialized_judges import JudgeFactory, SpecializedJudge
 from ..utils.logger import setup_logger
 from ..utils.config import load_config
+from ..utils.serialization import dumps, loads
 
 logger = setup_logger(__name__)
 
+# Judge panel used for shadow evaluations
+SHADOW_ARCHETYPES = ("technical_founder", "conservative_cfo", "growth_cmo")
+
+# Outcomes/recommendations that count as a positive (go-ahead) decision
+_POSITIVE_OUTCOMES = frozenset({"approved", "modified"})
+_POSITIVE_RECOMMENDATIONS = frozenset({"approve", "modify"})
+
+# Partial credit for (human outcome, Agentius recommendation) pairs that
+# aren't an exact match
+_PARTIAL_ACCURACY: Dict[Tuple[str, str], float] = {
+    ("approved", "approve"): 0.7,
+    ("approved", "modify"): 0.7,
+    ("rejected", "reject"): 0.7,
+    ("rejected", "modify"): 0.7,
+    ("modified", "modify"): 0.8,
+    ("modified", "approve"): 0.8
+}
+
+# Feedback themes, one named group per theme ("time" also covers "timeline")
+_FEEDBACK_THEMES = re.compile(
+    r"(?P<budget_concerns>budget)|(?P<timeline_concerns>time)|(?P<risk_concerns>risk)",
+    re.IGNORECASE
+)
+
+def _short_digest(text: str) -> str:
+    """8 hex-char digest of a proposal for observation ids (BLAKE3 when installed, else SHA-256)"""
+    if blake3 is not None:
+        return blake3(text.encode()).hexdigest(length=4)
+    return hashlib.sha256(text.encode()).hexdigest()[:8]
+
 @dataclass
 class ShadowObservation:
     """Single observation in shadow mode"""
@@ -57,13 +105,74 @@ class ShadowModeProcessor:
         self.shadow_data_path = Path(config.get("shadow_data_path", "/tmp/agentius_shadow"))
         self.shadow_data_path.mkdir(exist_ok=True)
         
-        self.observations: List[ShadowObservation] = []
+        # Hot window of recent observations; older ones live only in the log
+        self.observations: Deque[ShadowObservation] = deque(maxlen=config.get("shadow_mem_limit", 10_000))
+        self._obs_by_id: "weakref.WeakValueDictionary[str, ShadowObservation]" = weakref.WeakValueDictionary()
+        
+        # Columnar copy of the fields the metrics sweep over, one row per
+        # observation (same order as self.observations); accuracy is NaN
+        # until the human outcome is recorded. _row_by_id holds absolute row
+        # numbers; _row_base counts rows evicted from the front. Evicted rows
+        # stay as a dead prefix and are trimmed in batches; _col_base is the
+        # absolute row number of column index 0
+        self._cols: Dict[str, Any] = {
+            "acc": array("d"),
+            "conf": array("d"),
+            "ts": [],
+            "human": [],
+            "feedback": [],
+            "source": [],
+            "rec": [],
+            "archetypes": []
+        }
+        self._row_by_id: Dict[str, int] = {}
+        self._row_base = 0
+        self._col_base = 0
+        
+        # Running aggregates over the rows with outcomes, kept in step with
+        # the columns so routine metric checks don't rescan the window
+        self._m_sum_acc = 0.0
+        self._m_n = 0
+        self._m_conf: Counter = Counter({"tp": 0, "fp": 0, "tn": 0, "fn": 0})
+        self._m_arch: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+        self._last_metrics: Optional[ShadowLearningMetrics] = None
+        self._id_ctr = itertools.count()
         self.judge_factory = JudgeFactory()
+        self._judge_cache: Dict[str, SpecializedJudge] = {}
+        
+        # Shadow judges share the process-wide cap on concurrent judge calls
+        if "max_parallel_judges" in config:
+            set_max_parallel_judges(config["max_parallel_judges"])
+        
+        # Judge evaluations keyed by archetype + proposal + context, so a
+        # re-submitted proposal doesn't pay for the LLM calls again
+        self.judge_cache_enabled = config.get("judge_cache_enabled", True)
+        self._judge_cache_dir = self.shadow_data_path / "judge_cache"
+        if self.judge_cache_enabled:
+            self._judge_cache_dir.mkdir(exist_ok=True)
+        
+        # Dedicated writer thread: observation writes queue up in order here
+        # instead of competing with everything else in the default pool
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shadow-io")
+        
+        # Observation log records queued for disk; a background flusher
+        # appends them to the day's NDJSON log in batches
+        self._write_q: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._flusher: Optional[asyncio.Task] = None
+        self.write_batch_size = 64
+        
+        # Append-only descriptor for the current day's log; only touched on
+        # the writer thread, which also serializes the appends
+        self._log_fd: Optional[int] = None
+        self._log_fd_path: Optional[Path] = None
         
         # Learning thresholds
         self.min_confidence_threshold = 0.6
         self.learning_batch_size = 20
         self.accuracy_improvement_threshold = 0.05
+        
+        # Rebuild in-memory state from the observation log
+        self._load()
     
     async def observe_proposal(
         self, 
@@ -73,7 +182,9 @@ class ShadowModeProcessor:
     ) -> str:
         """Silently observe and evaluate a human proposal"""
         
-        observation_id = f"shadow_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{hashlib.md5(proposal_text.encode()).hexdigest()[:8]}"
+        # Fixed-width nanosecond clock keeps ids sortable; the counter keeps
+        # repeats of the same proposal unique within a clock tick
+        observation_id = f"shadow_{time.time_ns():016x}_{next(self._id_ctr):x}_{_short_digest(proposal_text)}"
         
         logger.info(f"Shadow observation started: {observation_id}")
         
@@ -98,7 +209,7 @@ class ShadowModeProcessor:
             
             # Store observation
             await self._store_observation(observation)
-            self.observations.append(observation)
+            self._index_observation(observation)
             
             logger.info(f"Shadow observation completed: {observation_id}")
             return observation_id
@@ -115,11 +226,12 @@ class ShadowModeProcessor:
     ):
         """Record the actual human decision for comparison"""
         
-        # Find observation
-        observation = next(
-            (obs for obs in self.observations if obs.id == observation_id), 
-            None
-        )
+        # Find observation; ones evicted from the window are read back from the log
+        observation = self._obs_by_id.get(observation_id)
+        
+        if not observation:
+            await self.flush()
+            observation = await asyncio.to_thread(self._find_logged_observation, observation_id)
         
         if not observation:
             logger.warning(f"Observation {observation_id} not found")
@@ -132,6 +244,8 @@ class ShadowModeProcessor:
         # Calculate accuracy
         accuracy = await self._calculate_prediction_accuracy(observation)
         observation.accuracy_score = accuracy
+        if observation.id in self._row_by_id:
+            self._update_row(observation)
         
         # Update stored observation
         await self._update_stored_observation(observation)
@@ -141,11 +255,109 @@ class ShadowModeProcessor:
             await self._generate_shadow_training_data(observation)
         
         # Check if we should trigger learning update
-        if len(self.observations) % self.learning_batch_size == 0:
+        # Count every observation seen, not just the in-memory window
+        if (self._row_base + len(self.observations)) % self.learning_batch_size == 0:
             await self._trigger_learning_update()
         
         logger.info(f"Human outcome recorded for {observation_id}: {human_outcome} (accuracy: {accuracy})")
     
+    def _index_observation(self, observation: ShadowObservation):
+        """Add an observation to the in-memory window, id index and metric columns"""
+        
+        if len(self.observations) == self.observations.maxlen:
+            self._evict_oldest()
+        
+        self.observations.append(observation)
+        self._obs_by_id[observation.id] = observation
+        self._append_row(observation)
+    
+    def _evict_oldest(self):
+        """Drop the oldest observation and its metric row from memory (it stays in the log)"""
+        
+        oldest = self.observations.popleft()
+        del self._row_by_id[oldest.id]
+        self._tally_row(self._row_base - self._col_base, -1)
+        self._row_base += 1
+        
+        # Trimming the front of a column shifts every row after it, so only
+        # trim once the dead prefix is as long as the live rows
+        dead = self._row_base - self._col_base
+        if dead >= len(self.observations):
+            for column in self._cols.values():
+                del column[:dead]
+            self._col_base = self._row_base
+    
+    def _iter_all_observations(
+        self,
+        window: Sequence[ShadowObservation],
+        since: Optional[datetime] = None
+    ) -> Iterator[ShadowObservation]:
+        """
+        Yield observations oldest first: evicted ones streamed back from the
+        log (only if the window doesn't already reach back to `since`), then
+        the given snapshot of the in-memory window
+        """
+        
+        window_covers = window and since is not None and window[0].timestamp <= since
+        if self._row_base and not window_covers:
+            window_ids = {obs.id for obs in window}
+            for observation in self._replay_log(since):
+                if observation.id not in window_ids and (since is None or observation.timestamp >= since):
+                    yield observation
+        
+        yield from window
+    
+    def _append_row(self, observation: ShadowObservation):
+        """Add an observation's row to the metric columns"""
+        
+        cols = self._cols
+        self._row_by_id[observation.id] = self._col_base + len(cols["acc"])
+        cols["acc"].append(math.nan)
+        cols["conf"].append(observation.agentius_prediction.get("confidence", 0))
+        cols["ts"].append(observation.timestamp)
+        cols["human"].append(None)
+        cols["feedback"].append(None)
+        cols["source"].append(observation.source)
+        cols["rec"].append(observation.agentius_prediction.get("recommendation", "").lower())
+        cols["archetypes"].append(frozenset(
+            j["archetype"] for j in observation.agentius_prediction.get("judge_evaluations", [])
+        ))
+    
+    def _update_row(self, observation: ShadowObservation):
+        """Refresh the outcome fields of an observation's row"""
+        
+        cols = self._cols
+        row = self._row_by_id[observation.id] - self._col_base
+        self._tally_row(row, -1)
+        cols["acc"][row] = math.nan if observation.accuracy_score is None else observation.accuracy_score
+        cols["human"][row] = observation.human_outcome.lower() if observation.human_outcome else None
+        cols["feedback"][row] = observation.human_feedback
+        self._tally_row(row, 1)
+    
+    def _tally_row(self, row: int, sign: int):
+        """Add (sign=1) or remove (sign=-1) a row's contribution to the running aggregates"""
+        
+        cols = self._cols
+        human = cols["human"][row]
+        accuracy = cols["acc"][row]
+        if not human or math.isnan(accuracy):
+            return
+        
+        self._m_n += sign
+        self._m_sum_acc += sign * accuracy
+        
+        human_approved = human in _POSITIVE_OUTCOMES
+        agentius_approved = cols["rec"][row] in _POSITIVE_RECOMMENDATIONS
+        if human_approved:
+            self._m_conf["tp" if agentius_approved else "fn"] += sign
+        else:
+            self._m_conf["fp" if agentius_approved else "tn"] += sign
+        
+        for archetype in cols["archetypes"][row]:
+            totals = self._m_arch[archetype]
+            totals[0] += sign * accuracy
+            totals[1] += sign
+    
     async def _run_silent_evaluation(
         self, 
         proposal_text: str,
@@ -168,14 +380,16 @@ class ShadowModeProcessor:
             # Calculate aggregate scores
             avg_score = sum(j["score"] for j in judge_results) / len(judge_results)
             
+            key_concerns, suggestions = self._extract_concerns_and_suggestions(judge_results)
+            
             # Make prediction
             prediction = {
                 "overall_score": avg_score,
                 "recommendation": "approve" if avg_score >= 7.0 else "reject" if avg_score < 5.0 else "modify",
                 "confidence": self._calculate_prediction_confidence(judge_results),
                 "judge_evaluations": judge_results,
-                "key_concerns": self._extract_key_concerns(judge_results),
-                "improvement_suggestions": self._extract_suggestions(judge_results)
+                "key_concerns": key_concerns,
+                "improvement_suggestions": suggestions
             }
             
             # Complete trace
@@ -197,45 +411,105 @@ class ShadowModeProcessor:
         """Run judge evaluations in shadow mode"""
         
         # Use standard archetypes
-        archetypes = ["technical_founder", "conservative_cfo", "growth_cmo"]
+        archetypes = SHADOW_ARCHETYPES
         judge_results = []
         
-        for archetype in archetypes:
-            try:
-                # Create judge
-                judge = self.judge_factory.create_judge(archetype, self.config)
-                
-                # Run evaluation
+        loop = asyncio.get_running_loop()
+        
+        # Run evaluations concurrently; judge latency dominates shadow mode
+        async def evaluate(archetype: str) -> Dict[str, Any]:
+            cache_path = None
+            if self.judge_cache_enabled:
+                cache_path = self._judge_cache_path(archetype, proposal_text, context)
+                cached = await loop.run_in_executor(
+                    self._io_executor, self._read_cached_evaluation, cache_path
+                )
+                if cached is not None:
+                    return cached
+            
+            judge = self._get_judge(archetype)
+            async with judge_slots():
                 evaluation = await judge.evaluate(proposal_text, context, iteration=1)
-                
-                # Convert to dict
-                result = {
-                    "archetype": archetype,
-                    "score": evaluation.score,
-                    "confidence": getattr(evaluation, 'confidence', 0.7),
-                    "objections": evaluation.objections,
-                    "suggestions": evaluation.suggestions,
-                    "strengths": evaluation.strengths,
-                    "concerns": evaluation.concerns
-                }
-                
-                judge_results.append(result)
-                
-                # Add to trace
-                global_tracer.add_decision_point(
-                    observation_id,
-                    DecisionType.JUDGE_EVALUATION,
-                    f"shadow_{archetype}_judge",
-                    [],  # No detailed reasoning chain in shadow mode
-                    result,
-                    result["confidence"]
+            
+            # Convert to dict
+            result = {
+                "archetype": archetype,
+                "score": evaluation.score,
+                "confidence": getattr(evaluation, 'confidence', 0.7),
+                "objections": evaluation.objections,
+                "suggestions": evaluation.suggestions,
+                "strengths": evaluation.strengths,
+                "concerns": evaluation.concerns
+            }
+            
+            if cache_path is not None:
+                await loop.run_in_executor(
+                    self._io_executor, self._write_cached_evaluation, cache_path, result
                 )
-                
-            except Exception as e:
-                logger.warning(f"Shadow judge {archetype} failed: {e}")
+            
+            return result
+        
+        evaluations = await asyncio.gather(
+            *(evaluate(archetype) for archetype in archetypes),
+            return_exceptions=True
+        )
+        
+        for archetype, result in zip(archetypes, evaluations):
+            if isinstance(result, Exception):
+                logger.warning(f"Shadow judge {archetype} failed: {result}")
+                continue
+            
+            judge_results.append(result)
+            
+            # Add to trace
+            global_tracer.add_decision_point(
+                observation_id,
+                DecisionType.JUDGE_EVALUATION,
+                f"shadow_{archetype}_judge",
+                [],  # No detailed reasoning chain in shadow mode
+                result,
+                result["confidence"]
+            )
         
         return judge_results
     
+    def _judge_cache_path(self, archetype: str, proposal_text: str, context: Dict[str, Any]) -> Path:
+        """Content-addressed cache file for one judge evaluation"""
+        
+        context_key = json.dumps(context, sort_keys=True, default=str)
+        key = hashlib.sha256(f"{archetype}:{proposal_text}:{context_key}".encode()).hexdigest()[:32]
+        return self._judge_cache_dir / f"{key}.json"
+    
+    def _read_cached_evaluation(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached judge evaluation, or None on a miss"""
+        
+        try:
+            return loads(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable judge cache entry {cache_path.name}: {e}")
+            return None
+    
+    def _write_cached_evaluation(self, cache_path: Path, result: Dict[str, Any]):
+        """Write a judge evaluation to the cache (tmp file + rename, so readers never see a partial entry)"""
+        
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(dumps(result))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to cache judge evaluation {cache_path.name}: {e}")
+    
+    def _get_judge(self, archetype: str) -> SpecializedJudge:
+        """Get the judge for an archetype, building it (and its LLM client) once"""
+        
+        judge = self._judge_cache.get(archetype)
+        if judge is None:
+            judge = self.judge_factory.create_judge(archetype, self.config)
+            self._judge_cache[archetype] = judge
+        return judge
+    
     def _calculate_prediction_confidence(self, judge_results: List[Dict[str, Any]]) -> float:
         """Calculate overall confidence in prediction"""
         
@@ -243,38 +517,30 @@ class ShadowModeProcessor:
             return 0.0
         
         # Average judge confidence
-        avg_confidence = sum(j["confidence"] for j in judge_results) / len(judge_results)
+        avg_confidence = fmean(j["confidence"] for j in judge_results)
         
         # Score consistency (lower variance = higher confidence)
-        scores = [j["score"] for j in judge_results]
-        if len(scores) > 1:
-            mean_score = sum(scores) / len(scores)
-            variance = sum((score - mean_score) ** 2 for score in scores) / len(scores)
+        if len(judge_results) > 1:
+            variance = pvariance([j["score"] for j in judge_results])
             consistency_factor = max(0.0, 1.0 - variance / 10.0)
         else:
             consistency_factor = 1.0
         
         return avg_confidence * consistency_factor
     
-    def _extract_key_concerns(self, judge_results: List[Dict[str, Any]]) -> List[str]:
-        """Extract most common concerns across judges"""
+    def _extract_concerns_and_suggestions(self, judge_results: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+        """Extract concerns/objections and improvement suggestions across judges"""
         
-        all_concerns = []
+        # dicts keep first-seen order while dropping duplicates
+        all_concerns: Dict[str, None] = {}
+        all_suggestions: Dict[str, None] = {}
         for result in judge_results:
-            all_concerns.extend(result.get("concerns", []))
-            all_concerns.extend(result.get("objections", []))
+            all_concerns.update(dict.fromkeys(result.get("concerns", [])))
+            all_concerns.update(dict.fromkeys(result.get("objections", [])))
+            all_suggestions.update(dict.fromkeys(result.get("suggestions", [])))
         
         # Return unique concerns
-        return list(set(all_concerns))
-    
-    def _extract_suggestions(self, judge_results: List[Dict[str, Any]]) -> List[str]:
-        """Extract improvement suggestions"""
-        
-        all_suggestions = []
-        for result in judge_results:
-            all_suggestions.extend(result.get("suggestions", []))
-        
-        return list(set(all_suggestions))
+        return list(all_concerns), list(all_suggestions)
     
     async def _calculate_prediction_accuracy(self, observation: ShadowObservation) -> Optional[float]:
         """Calculate how accurate Agentius prediction was vs human decision"""
@@ -290,14 +556,7 @@ class ShadowModeProcessor:
             return 1.0
         
         # Partial matches
-        if human_outcome == "approved" and agentius_recommendation in ["approve", "modify"]:
-            return 0.7
-        elif human_outcome == "rejected" and agentius_recommendation in ["reject", "modify"]:
-            return 0.7
-        elif human_outcome == "modified" and agentius_recommendation in ["modify", "approve"]:
-            return 0.8
-        else:
-            return 0.0
+        return _PARTIAL_ACCURACY.get((human_outcome, agentius_recommendation), 0.0)
     
     async def _generate_shadow_training_data(self, observation: ShadowObservation):
         """Generate training data from shadow observation"""
@@ -315,11 +574,11 @@ class ShadowModeProcessor:
             # Create training example
             example = TrainingExample(
                 input_prompt=f"Evaluate this proposal as a {archetype}: {observation.proposal_text}",
-                expected_output=json.dumps({
+                expected_output=dumps({
                     "score": judge_result["score"],
                     "objections": judge_result["objections"],
                     "suggestions": judge_result["suggestions"]
-                }),
+                }).decode(),
                 context={
                     "archetype": archetype,
                     "human_outcome": observation.human_outcome,
@@ -335,31 +594,207 @@ class ShadowModeProcessor:
             training_examples.append(example)
         
         # Store training examples
+        # Looked up at call time; the orchestrator is created by initialize_training_system
+        training_orchestrator = training_engine.training_orchestrator
         if training_examples and training_orchestrator:
             await training_orchestrator._store_training_examples(training_examples)
             logger.info(f"Generated {len(training_examples)} shadow training examples")
     
-    async def _store_observation(self, observation: ShadowObservation):
-        """Store observation to disk"""
+    def _log_path(self) -> Path:
+        """Today's observation log"""
+        return self.shadow_data_path / f"events_{datetime.utcnow().date()}.ndjson"
+    
+    def _append_log(self, records: List[Dict[str, Any]]):
+        """Serialize a batch of log records and append it in one write (runs on the writer thread)"""
+        
+        data = memoryview(b"".join(dumps(record) + b"\n" for record in records))
         
-        file_path = self.shadow_data_path / f"{observation.id}.json"
+        # Reopen only when the day rolls over
+        log_path = self._log_path()
+        if log_path != self._log_fd_path:
+            self._close_log()
+            self._log_fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+            self._log_fd_path = log_path
         
-        with open(file_path, 'w') as f:
-            json.dump(asdict(observation), f, default=str, indent=2)
+        while data:
+            written = os.write(self._log_fd, data)
+            data = data[written:]
+    
+    def _close_log(self):
+        """Close the log descriptor, if open (runs on the writer thread)"""
+        
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+            self._log_fd_path = None
+    
+    def _read_log(self, since: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+        """Stream log records line by line, oldest day first, skipping day logs before `since`"""
+        
+        # Day logs sort chronologically by name
+        first_name = f"events_{since}.ndjson" if since is not None else ""
+        log_names = sorted(
+            entry.name for entry in os.scandir(self.shadow_data_path)
+            if entry.name.startswith("events_") and entry.name.endswith(".ndjson")
+            and entry.name >= first_name and entry.is_file()
+        )
+        
+        for log_name in log_names:
+            with open(self.shadow_data_path / log_name, 'rb') as f:
+                for line in f:
+                    try:
+                        yield loads(line)
+                    except Exception:
+                        # A torn final line from a crash mid-append
+                        logger.warning(f"Skipping unreadable record in {log_name}")
+    
+    @staticmethod
+    def _observation_from_record(record: Dict[str, Any]) -> ShadowObservation:
+        """Rebuild an observation from its insert record"""
+        data = record["obs"]
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return ShadowObservation(**data)
+    
+    @staticmethod
+    def _apply_update(observation: ShadowObservation, record: Dict[str, Any]):
+        """Fold an update record's human outcome into its observation"""
+        observation.human_outcome = record["human_outcome"]
+        observation.human_feedback = record["human_feedback"]
+        observation.accuracy_score = record["accuracy_score"]
+    
+    def _replay_log(self, since: Optional[datetime] = None) -> Iterator[ShadowObservation]:
+        """
+        Stream observations from the logs, oldest first, with their recorded
+        outcomes applied; only day logs from `since` on are read
+        """
+        
+        since_day = since.date() if since is not None else None
+        
+        # Update records are small; collecting them first lets the inserts,
+        # which carry the proposal text, stream through one at a time
+        updates = {
+            record["id"]: record for record in self._read_log(since_day)
+            if record["op"] == "update"
+        }
+        
+        for record in self._read_log(since_day):
+            if record["op"] == "insert":
+                observation = self._observation_from_record(record)
+                update = updates.get(observation.id)
+                if update is not None:
+                    self._apply_update(observation, update)
+                yield observation
+    
+    def _find_logged_observation(self, observation_id: str) -> Optional[ShadowObservation]:
+        """Read one observation (with any recorded outcome) back from the logs"""
+        
+        # Ids embed their creation time, so earlier day logs can be skipped
+        try:
+            created_ns = int(observation_id.split("_")[1], 16)
+            since_day = datetime.fromtimestamp(created_ns / 1e9, timezone.utc).date()
+        except (IndexError, ValueError):
+            since_day = None
+        
+        observation = None
+        for record in self._read_log(since_day):
+            if record["op"] == "insert" and record["obs"]["id"] == observation_id:
+                observation = self._observation_from_record(record)
+            elif record["op"] == "update" and observation is not None and record["id"] == observation_id:
+                self._apply_update(observation, record)
+        
+        return observation
+    
+    def _load(self):
+        """Rebuild the in-memory window from the observation logs"""
+        
+        # Only the newest observations fit in the window; older inserts pass
+        # through the bounded deque without being kept
+        window: Deque[ShadowObservation] = deque(maxlen=self.observations.maxlen)
+        total = 0
+        for record in self._read_log():
+            if record["op"] == "insert":
+                window.append(self._observation_from_record(record))
+                total += 1
+        
+        by_id = {observation.id: observation for observation in window}
+        for record in self._read_log():
+            if record["op"] == "update" and record["id"] in by_id:
+                self._apply_update(by_id[record["id"]], record)
+        
+        self._row_base = self._col_base = total - len(window)
+        for observation in window:
+            self._index_observation(observation)
+            if observation.human_outcome:
+                self._update_row(observation)
+        
+        if total:
+            logger.info(f"Loaded {total} shadow observations from log")
+    
+    async def _flush_loop(self):
+        """Drain queued log records and append them in batches"""
+        
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._write_q.get()]
+            while len(batch) < self.write_batch_size and not self._write_q.empty():
+                batch.append(self._write_q.get_nowait())
+            
+            try:
+                await loop.run_in_executor(self._io_executor, self._append_log, batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} shadow log records: {e}")
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+    
+    async def _enqueue_write(self, record: Dict[str, Any]):
+        """Queue a log record for the background flusher"""
+        
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        
+        await self._write_q.put(record)
+    
+    async def _store_observation(self, observation: ShadowObservation):
+        """Store observation to disk"""
+        await self._enqueue_write({"op": "insert", "obs": observation})
     
     async def _update_stored_observation(self, observation: ShadowObservation):
         """Update stored observation with human outcome"""
+        await self._enqueue_write({
+            "op": "update",
+            "id": observation.id,
+            "human_outcome": observation.human_outcome,
+            "human_feedback": observation.human_feedback,
+            "accuracy_score": observation.accuracy_score
+        })
+    
+    async def flush(self):
+        """Wait until every queued log record has been written"""
+        await self._write_q.join()
+    
+    async def aclose(self):
+        """Flush pending observation writes, close the log and release the writer thread"""
         
-        file_path = self.shadow_data_path / f"{observation.id}.json"
+        await self.flush()
         
-        with open(file_path, 'w') as f:
-            json.dump(asdict(observation), f, default=str, indent=2)
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        
+        await asyncio.get_running_loop().run_in_executor(self._io_executor, self._close_log)
+        await asyncio.to_thread(self._io_executor.shutdown, wait=True)
     
     async def _trigger_learning_update(self):
         """Trigger learning update based on accumulated observations"""
         
-        # Calculate current metrics
-        metrics = await self.calculate_shadow_metrics()
+        # Calculate current metrics (running aggregates, no rescan)
+        metrics = await self.calculate_shadow_metrics(recompute=False)
         
         logger.info(f"Shadow learning update: accuracy={metrics.prediction_accuracy:.2f}")
         
@@ -367,18 +802,80 @@ class ShadowModeProcessor:
         if metrics.prediction_accuracy < 0.7:
             logger.info("Prediction accuracy below threshold - triggering retraining")
             
+            # Coalesces with a retraining run already in flight
+            training_orchestrator = training_engine.training_orchestrator
             if training_orchestrator:
-                await training_orchestrator._trigger_retraining()
+                training_orchestrator.request_retraining()
+    
+    def _snapshot_cols(self) -> Dict[str, Sequence]:
+        """Copy the metric columns so they can be read off the event loop"""
+        dead = self._row_base - self._col_base
+        return {name: column[dead:] for name, column in self._cols.items()}
+    
+    async def calculate_shadow_metrics(self, recompute: bool = True) -> ShadowLearningMetrics:
+        """
+        Calculate comprehensive shadow learning metrics
+        
+        With recompute=False, accuracy and error rates come from the running
+        aggregates in O(1); failure patterns, improvement rate and confidence
+        calibration are carried over from the last full computation.
+        """
+        
+        if not recompute:
+            return self._running_metrics()
+        
+        # The sweep is pure CPU work; run it on a snapshot in a worker thread
+        # so concurrent observations aren't stalled behind it
+        metrics = await asyncio.to_thread(self._calculate_shadow_metrics_sync, self._snapshot_cols())
+        self._last_metrics = metrics
+        return metrics
+    
+    def _running_metrics(self) -> ShadowLearningMetrics:
+        """Build metrics from the running aggregates"""
+        
+        last = self._last_metrics
+        
+        if self._m_n <= 0:
+            return ShadowLearningMetrics(
+                total_observations=0,
+                prediction_accuracy=0.0,
+                judge_accuracy_by_archetype={},
+                common_failure_patterns=[],
+                improvement_rate=0.0,
+                confidence_calibration=0.0,
+                false_positive_rate=0.0,
+                false_negative_rate=0.0
+            )
+        
+        conf = self._m_conf
+        total_negative = conf["fp"] + conf["tn"]
+        total_positive = conf["tp"] + conf["fn"]
+        
+        return ShadowLearningMetrics(
+            total_observations=self._m_n,
+            prediction_accuracy=self._m_sum_acc / self._m_n,
+            judge_accuracy_by_archetype={
+                archetype: self._m_arch[archetype][0] / self._m_arch[archetype][1]
+                for archetype in SHADOW_ARCHETYPES
+                if self._m_arch[archetype][1] > 0
+            },
+            common_failure_patterns=last.common_failure_patterns if last else [],
+            improvement_rate=last.improvement_rate if last else 0.0,
+            confidence_calibration=last.confidence_calibration if last else 0.5,
+            false_positive_rate=conf["fp"] / total_negative if total_negative > 0 else 0.0,
+            false_negative_rate=conf["fn"] / total_positive if total_positive > 0 else 0.0
+        )
     
-    async def calculate_shadow_metrics(self) -> ShadowLearningMetrics:
-        """Calculate comprehensive shadow learning metrics"""
+    def _calculate_shadow_metrics_sync(self, snapshot: Dict[str, Sequence]) -> ShadowLearningMetrics:
+        """Calculate shadow learning metrics from a snapshot of the metric columns"""
         
-        observations_with_outcomes = [
-            obs for obs in self.observations 
-            if obs.human_outcome and obs.accuracy_score is not None
+        all_acc = snapshot["acc"]
+        rows = [
+            row for row, human in enumerate(snapshot["human"])
+            if human and not math.isnan(all_acc[row])
         ]
         
-        if not observations_with_outcomes:
+        if not rows:
             return ShadowLearningMetrics(
                 total_observations=0,
                 prediction_accuracy=0.0,
@@ -390,56 +887,57 @@ class ShadowModeProcessor:
                 false_negative_rate=0.0
             )
         
+        # Gather the rows with outcomes column by column
+        cols = {name: [column[row] for row in rows] for name, column in snapshot.items()}
+        
         # Overall accuracy
-        total_accuracy = sum(obs.accuracy_score for obs in observations_with_outcomes) / len(observations_with_outcomes)
+        total_accuracy = fmean(cols["acc"])
         
-        # Accuracy by archetype
-        archetype_accuracy = {}
-        for archetype in ["technical_founder", "conservative_cfo", "growth_cmo"]:
-            archetype_scores = []
-            
-            for obs in observations_with_outcomes:
-                judge_evals = obs.agentius_prediction.get("judge_evaluations", [])
-                archetype_eval = next((j for j in judge_evals if j["archetype"] == archetype), None)
-                
-                if archetype_eval:
+        # Accuracy by archetype, in one sweep over the rows
+        archetype_scores = {archetype: [] for archetype in SHADOW_ARCHETYPES}
+        for evaluated, accuracy in zip(cols["archetypes"], cols["acc"]):
+            for archetype, scores in archetype_scores.items():
+                if archetype in evaluated:
                     # Calculate archetype-specific accuracy
-                    archetype_scores.append(obs.accuracy_score)
-            
-            if archetype_scores:
-                archetype_accuracy[archetype] = sum(archetype_scores) / len(archetype_scores)
+                    scores.append(accuracy)
+        
+        archetype_accuracy = {
+            archetype: fmean(scores)
+            for archetype, scores in archetype_scores.items()
+            if scores
+        }
         
         # Failure patterns
-        failure_patterns = self._analyze_failure_patterns(observations_with_outcomes)
+        failure_patterns = self._analyze_failure_patterns(cols)
         
         # Improvement rate (last 10 vs previous 10)
-        improvement_rate = self._calculate_improvement_rate(observations_with_outcomes)
+        improvement_rate = self._calculate_improvement_rate(cols)
         
         # False positive/negative rates
-        fp_rate, fn_rate = self._calculate_error_rates(observations_with_outcomes)
+        fp_rate, fn_rate = self._calculate_error_rates(cols)
         
         return ShadowLearningMetrics(
-            total_observations=len(observations_with_outcomes),
+            total_observations=len(rows),
             prediction_accuracy=total_accuracy,
             judge_accuracy_by_archetype=archetype_accuracy,
             common_failure_patterns=failure_patterns,
             improvement_rate=improvement_rate,
-            confidence_calibration=self._calculate_confidence_calibration(observations_with_outcomes),
+            confidence_calibration=self._calculate_confidence_calibration(cols),
             false_positive_rate=fp_rate,
             false_negative_rate=fn_rate
         )
     
-    def _analyze_failure_patterns(self, observations: List[ShadowObservation]) -> List[str]:
+    def _analyze_failure_patterns(self, cols: Dict[str, Sequence]) -> List[str]:
         """Analyze common patterns in failed predictions"""
         
-        failures = [obs for obs in observations if obs.accuracy_score < 0.5]
+        failures = [row for row, accuracy in enumerate(cols["acc"]) if accuracy < 0.5]
         
         patterns = []
         
         # Analyze by source
         source_failures = {}
-        for obs in failures:
-            source = obs.source
+        for row in failures:
+            source = cols["source"][row]
             if source not in source_failures:
                 source_failures[source] = 0
             source_failures[source] += 1
@@ -449,88 +947,76 @@ class ShadowModeProcessor:
             if source_failures[worst_source] > len(failures) * 0.3:
                 patterns.append(f"High failure rate with {worst_source} source")
         
-        # Analyze by human feedback themes
-        feedback_themes = []
-        for obs in failures:
-            if obs.human_feedback:
-                feedback_themes.append(obs.human_feedback.lower())
-        
+        # Analyze by human feedback themes, one regex scan per feedback string
         common_feedback = set()
-        for feedback in feedback_themes:
-            if "budget" in feedback:
-                common_feedback.add("budget_concerns")
-            if "timeline" in feedback or "time" in feedback:
-                common_feedback.add("timeline_concerns")
-            if "risk" in feedback:
-                common_feedback.add("risk_concerns")
+        for row in failures:
+            feedback = cols["feedback"][row]
+            if feedback:
+                common_feedback.update(match.lastgroup for match in _FEEDBACK_THEMES.finditer(feedback))
         
         patterns.extend(list(common_feedback))
         
         return patterns[:5]  # Top 5 patterns
     
-    def _calculate_improvement_rate(self, observations: List[ShadowObservation]) -> float:
+    def _calculate_improvement_rate(self, cols: Dict[str, Sequence]) -> float:
         """Calculate improvement rate over time"""
         
-        if len(observations) < 20:
+        if len(cols["acc"]) < 20:
             return 0.0
         
-        # Sort by timestamp
-        sorted_obs = sorted(observations, key=lambda x: x.timestamp)
+        # Accuracy in timestamp order
+        order = sorted(range(len(cols["ts"])), key=cols["ts"].__getitem__)
+        accuracy = [cols["acc"][row] for row in order]
         
         # Compare first half vs second half
-        midpoint = len(sorted_obs) // 2
-        first_half = sorted_obs[:midpoint]
-        second_half = sorted_obs[midpoint:]
-        
-        first_avg = sum(obs.accuracy_score for obs in first_half) / len(first_half)
-        second_avg = sum(obs.accuracy_score for obs in second_half) / len(second_half)
+        midpoint = len(accuracy) // 2
         
-        return second_avg - first_avg
+        return fmean(accuracy[midpoint:]) - fmean(accuracy[:midpoint])
     
-    def _calculate_error_rates(self, observations: List[ShadowObservation]) -> Tuple[float, float]:
+    def _calculate_error_rates(self, cols: Dict[str, Sequence]) -> Tuple[float, float]:
         """Calculate false positive and false negative rates"""
         
-        true_positives = 0
+        # Human approval splits positives/negatives; only the mismatches
+        # need counting separately
+        total_positive = 0
         false_positives = 0
-        true_negatives = 0
         false_negatives = 0
         
-        for obs in observations:
-            human_approved = obs.human_outcome.lower() in ["approved", "modified"]
-            agentius_approved = obs.agentius_prediction.get("recommendation", "").lower() in ["approve", "modify"]
+        for human, recommendation in zip(cols["human"], cols["rec"]):
+            human_approved = human in _POSITIVE_OUTCOMES
+            agentius_approved = recommendation in _POSITIVE_RECOMMENDATIONS
             
-            if human_approved and agentius_approved:
-                true_positives += 1
-            elif not human_approved and not agentius_approved:
-                true_negatives += 1
-            elif not human_approved and agentius_approved:
-                false_positives += 1
-            elif human_approved and not agentius_approved:
-                false_negatives += 1
-        
-        total_negative = true_negatives + false_positives
-        total_positive = true_positives + false_negatives
+            total_positive += human_approved
+            false_positives += agentius_approved and not human_approved
+            false_negatives += human_approved and not agentius_approved
+        
+        total_negative = len(cols["human"]) - total_positive
         
         fp_rate = false_positives / total_negative if total_negative > 0 else 0.0
         fn_rate = false_negatives / total_positive if total_positive > 0 else 0.0
         
         return fp_rate, fn_rate
     
-    def _calculate_confidence_calibration(self, observations: List[ShadowObservation]) -> float:
+    def _calculate_confidence_calibration(self, cols: Dict[str, Sequence]) -> float:
         """Calculate how well confidence correlates with accuracy"""
         
-        if len(observations) < 5:
+        if len(cols["acc"]) < 5:
             return 0.5
         
-        # Group by confidence levels
-        high_conf = [obs for obs in observations if obs.agentius_prediction.get("confidence", 0) > 0.8]
-        low_conf = [obs for obs in observations if obs.agentius_prediction.get("confidence", 0) < 0.5]
+        # Group by confidence levels in a single pass
+        high_conf = []
+        low_conf = []
+        for confidence, accuracy in zip(cols["conf"], cols["acc"]):
+            if confidence > 0.8:
+                high_conf.append(accuracy)
+            elif confidence < 0.5:
+                low_conf.append(accuracy)
         
         if not high_conf or not low_conf:
             return 0.5
         
-        high_conf_accuracy = sum(obs.accuracy_score for obs in high_conf) / len(high_conf)
-        low_conf_accuracy = sum(obs.accuracy_score for obs in low_conf) / len(low_conf)
+        high_conf_accuracy = fmean(high_conf)
+        low_conf_accuracy = fmean(low_conf)
         
         # Good calibration means high confidence predictions are more accurate
         calibration = high_conf_accuracy - low_conf_accuracy
@@ -540,19 +1026,30 @@ class ShadowModeProcessor:
     async def get_shadow_report(self, days: int = 30) -> Dict[str, Any]:
         """Generate comprehensive shadow mode report"""
         
+        # Calculate metrics
+        metrics = await self.calculate_shadow_metrics()
+        
+        # Trends (and any log replay for evicted history) run off the event loop
+        return await asyncio.to_thread(self._build_shadow_report, days, list(self.observations), metrics)
+    
+    def _build_shadow_report(
+        self,
+        days: int,
+        window: List[ShadowObservation],
+        metrics: ShadowLearningMetrics
+    ) -> Dict[str, Any]:
+        """Build the shadow report from a snapshot of the in-memory window"""
+        
         # Filter recent observations
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         recent_observations = [
-            obs for obs in self.observations 
+            obs for obs in self._iter_all_observations(window, since=cutoff_date)
             if obs.timestamp >= cutoff_date
         ]
         
         if not recent_observations:
             return {"error": "No shadow observations in the specified period"}
         
-        # Calculate metrics
-        metrics = await self.calculate_shadow_metrics()
-        
         # Performance trends
         weekly_accuracy = self._calculate_weekly_accuracy_trend(recent_observations)
         
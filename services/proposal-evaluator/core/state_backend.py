@@ -0,0 +1,187 @@
+"""
+Event/Task State Persistence for Agentius
+=========================================
+
+Pluggable storage for the EventBus: an append-only event log plus a
+compact per-task snapshot, so evaluation contexts survive restarts and
+can be replayed without keeping every context in memory.
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Deque, Protocol
+
+from .event_system import Event, EventType, TaskRegistration
+from ..utils.logger import setup_logger
+from ..utils.serialization import dumps, loads
+
+logger = setup_logger(__name__)
+
+class StateBackend(Protocol):
+    """Storage interface used by the EventBus"""
+    
+    def append_event(self, event: Event) -> None:
+        """Append an event to the context's log"""
+        ...
+    
+    def put_task(self, task: TaskRegistration) -> None:
+        """Insert or replace the latest snapshot of a task"""
+        ...
+    
+    def load_context(self, context_id: str) -> Tuple[List[Event], List[TaskRegistration]]:
+        """Load a context's event log (oldest first) and task snapshots"""
+        ...
+
+class InMemoryBackend:
+    """
+    Process-local backend
+    Keeps the most recent contexts only, each with a bounded event log
+    """
+    
+    def __init__(self, max_contexts: int = 1_000, max_events_per_context: int = 1_000):
+        self.max_contexts = max_contexts
+        self.max_events_per_context = max_events_per_context
+        # Writes arrive on the EventBus persist thread, reads via to_thread
+        self._lock = threading.Lock()
+        self._events: "OrderedDict[str, Deque[Event]]" = OrderedDict()
+        self._tasks: "OrderedDict[str, Dict[str, TaskRegistration]]" = OrderedDict()
+    
+    def _touch(self, store: OrderedDict, context_id: str, factory):
+        """Fetch a context's entry, marking it most recent and evicting the oldest"""
+        if context_id in store:
+            store.move_to_end(context_id)
+        else:
+            store[context_id] = factory()
+            if len(store) > self.max_contexts:
+                store.popitem(last=False)
+        return store[context_id]
+    
+    def append_event(self, event: Event) -> None:
+        with self._lock:
+            events = self._touch(
+                self._events, event.context_id,
+                lambda: deque(maxlen=self.max_events_per_context)
+            )
+            events.append(event)
+    
+    def put_task(self, task: TaskRegistration) -> None:
+        with self._lock:
+            tasks = self._touch(self._tasks, task.context_id, dict)
+            tasks[task.id] = task
+    
+    def load_context(self, context_id: str) -> Tuple[List[Event], List[TaskRegistration]]:
+        with self._lock:
+            events = list(self._events.get(context_id, ()))
+            tasks = list(self._tasks.get(context_id, {}).values())
+        return events, tasks
+
+class SQLiteBackend:
+    """
+    SQLite backend
+    Events go to an append-only table indexed on (context_id, id); tasks
+    are upserted into a snapshot table so a context loads as snapshot + log
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS events (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            context_id TEXT NOT NULL,
+            id TEXT NOT NULL,
+            type TEXT NOT NULL,
+            agent_id TEXT,
+            correlation_id TEXT,
+            payload_json BLOB NOT NULL,
+            ts INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_events_context ON events (context_id, id);
+        CREATE TABLE IF NOT EXISTS tasks (
+            id TEXT PRIMARY KEY,
+            context_id TEXT NOT NULL,
+            task_json BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_context ON tasks (context_id);
+    """
+    
+    _TASK_TIME_FIELDS = ("created_at", "started_at", "completed_at")
+    
+    def __init__(self, db_path: str = "data/agentius_state.db"):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        
+        logger.info(f"SQLite state backend at {db_path}")
+    
+    def append_event(self, event: Event) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO events (context_id, id, type, agent_id, correlation_id, payload_json, ts) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    event.context_id,
+                    event.id,
+                    event.type.value,
+                    event.agent_id,
+                    event.correlation_id,
+                    event.payload_bytes,
+                    event.timestamp_ns
+                )
+            )
+    
+    def put_task(self, task: TaskRegistration) -> None:
+        task_data = task.to_dict()
+        for field in self._TASK_TIME_FIELDS:
+            if task_data[field] is not None:
+                task_data[field] = task_data[field].isoformat()
+        
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tasks (id, context_id, task_json) VALUES (?, ?, ?)",
+                (task.id, task.context_id, dumps(task_data))
+            )
+    
+    def load_context(self, context_id: str) -> Tuple[List[Event], List[TaskRegistration]]:
+        with self._lock:
+            event_rows = self._conn.execute(
+                "SELECT id, type, agent_id, correlation_id, payload_json, ts "
+                "FROM events WHERE context_id = ? ORDER BY seq",
+                (context_id,)
+            ).fetchall()
+            task_rows = self._conn.execute(
+                "SELECT task_json FROM tasks WHERE context_id = ?",
+                (context_id,)
+            ).fetchall()
+        
+        events = [
+            Event(
+                id=event_id,
+                type=EventType(event_type),
+                payload=loads(payload_json),
+                context_id=context_id,
+                agent_id=agent_id,
+                timestamp_ns=ts,
+                correlation_id=correlation_id
+            )
+            for event_id, event_type, agent_id, correlation_id, payload_json, ts in event_rows
+        ]
+        
+        tasks = []
+        for (task_json,) in task_rows:
+            task_data: Dict[str, Any] = loads(task_json)
+            for field in self._TASK_TIME_FIELDS:
+                if task_data[field] is not None:
+                    task_data[field] = datetime.fromisoformat(task_data[field])
+            tasks.append(TaskRegistration(**task_data))
+        
+        return events, tasks
+    
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
@@ -7,8 +7,15 @@ Converts live evaluation data into training datasets for continuous model improv
 
 import json
 import asyncio
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+import bisect
+import fcntl
+import os
+import re
+from array import array
+from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional, Tuple, Deque
+from dataclasses import dataclass
+from statistics import pvariance
 from datetime import datetime, timedelta
 from pathlib import Path
 import hashlib
@@ -16,10 +23,11 @@ import hashlib
 from .decision_tracer import global_tracer, DecisionType
 from ..utils.logger import setup_logger
 from ..utils.config import load_config
+from ..utils.serialization import dumps, loads
 
 logger = setup_logger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class TrainingExample:
     """Single training example for fine-tuning"""
     input_prompt: str
@@ -31,7 +39,7 @@ class TrainingExample:
     outcome_quality: str  # "excellent", "good", "poor", "failed"
     feedback_source: str  # "client_approval", "score_improvement", "human_feedback"
 
-@dataclass
+@dataclass(slots=True)
 class ModelPerformanceMetrics:
     """Track model performance over time"""
     archetype: str
@@ -44,6 +52,60 @@ class ModelPerformanceMetrics:
     total_evaluations: int
     successful_outcomes: int
 
+# Outcome qualities that count as a successful example
+_GOOD_OUTCOMES = frozenset({"excellent", "good"})
+
+# Performance score thresholds and the outcome quality at or above each
+_OUTCOME_THRESHOLDS = (0.5, 1.5, 3.0)
+_OUTCOME_QUALITIES = ("poor", "fair", "good", "excellent")
+
+# Consolidated retraining datasets and the rows each one selects
+_DATASET_FILTERS = {
+    "high_quality": lambda example_data: example_data["outcome_quality"] in _GOOD_OUTCOMES,
+    "fear_detection": lambda example_data: example_data["feedback_source"] == "fear_detection",
+    "refinement": lambda example_data: example_data["archetype"] == "refiner"
+}
+
+def _fingerprint(input_prompt: str, expected_output: str) -> int:
+    """64-bit content fingerprint of an example's prompt/output pair"""
+    
+    digest = hashlib.blake2b(f"{input_prompt}\0{expected_output}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+def _partition_training_file(file_path: Path) -> Dict[str, List[Tuple[int, Dict[str, Any]]]]:
+    """
+    Parse one JSONL training file and bucket its rows by retraining dataset
+    (blocking; run in a thread). Rows no dataset selects are dropped as they
+    are read; the rest come back paired with their fingerprint so the
+    caller can drop duplicates across files
+    """
+    
+    partitions: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {name: [] for name in _DATASET_FILTERS}
+    
+    with open(file_path, 'rb') as f:
+        for line in f:
+            example_data = loads(line)
+            fingerprint = None
+            for name, selects in _DATASET_FILTERS.items():
+                if selects(example_data):
+                    if fingerprint is None:
+                        fingerprint = _fingerprint(example_data["input_prompt"], example_data["expected_output"])
+                    partitions[name].append((fingerprint, example_data))
+    
+    return partitions
+
+# Reasoning that mentions fear is attributed every known fear code (simplified)
+_FEAR_RE = re.compile(r"fear", re.IGNORECASE)
+_FEAR_CODES = ("technical_debt", "vendor_lock", "budget_risk", "compliance_risk", "brand_damage")
+
+def _group_by_archetype(examples: List[TrainingExample]) -> Dict[str, List[TrainingExample]]:
+    """Partition examples by archetype in a single pass"""
+    
+    by_archetype: Dict[str, List[TrainingExample]] = defaultdict(list)
+    for example in examples:
+        by_archetype[example.archetype].append(example)
+    return by_archetype
+
 class TrainingDataGenerator:
     """Generates high-quality training data from evaluation sessions"""
     
@@ -64,30 +126,39 @@ class TrainingDataGenerator:
         if not trace or trace["metadata"]["completion_status"] != "completed":
             return []
         
-        examples = []
+        # Score changes between iterations, shared by every decision below
+        score_deltas = self._score_deltas(trace)
         
-        # Extract judge training examples
-        for decision in trace["decision_points"]:
-            if decision["decision_type"] == DecisionType.JUDGE_EVALUATION:
-                example = await self._extract_judge_example(decision, trace)
-                if example and self._is_high_quality_example(example):
-                    examples.append(example)
+        # Extract judge and refiner training examples in one pass over the
+        # decisions, keeping judge examples ahead of refiner ones
+        judge_examples: List[TrainingExample] = []
+        refiner_examples: List[TrainingExample] = []
+        extractors = {
+            DecisionType.JUDGE_EVALUATION: (self._extract_judge_example, judge_examples),
+            DecisionType.REFINEMENT_STRATEGY: (self._extract_refiner_example, refiner_examples)
+        }
         
-        # Extract refiner training examples
         for decision in trace["decision_points"]:
-            if decision["decision_type"] == DecisionType.REFINEMENT_STRATEGY:
-                example = await self._extract_refiner_example(decision, trace)
+            extractor = extractors.get(decision["decision_type"])
+            if extractor:
+                extract, bucket = extractor
+                example = extract(decision, trace, score_deltas)
                 if example and self._is_high_quality_example(example):
-                    examples.append(example)
+                    bucket.append(example)
         
         # Extract fear detection examples
-        fear_examples = await self._extract_fear_detection_examples(trace)
-        examples.extend(fear_examples)
+        examples = judge_examples + refiner_examples
+        examples.extend(self._extract_fear_detection_examples(trace))
         
         logger.info(f"Extracted {len(examples)} training examples from context {context_id}")
         return examples
     
-    async def _extract_judge_example(self, decision: Dict[str, Any], trace: Dict[str, Any]) -> Optional[TrainingExample]:
+    def _extract_judge_example(
+        self,
+        decision: Dict[str, Any],
+        trace: Dict[str, Any],
+        score_deltas: List[Tuple[datetime, List[float]]]
+    ) -> Optional[TrainingExample]:
         """Extract judge evaluation training example"""
         
         try:
@@ -97,27 +168,31 @@ class TrainingDataGenerator:
                 return None
             
             # Get the proposal input
-            proposal_step = next((step for step in reasoning_chain if step["step_type"] == "proposal_analysis"), None)
-            if not proposal_step:
+            for step in reasoning_chain:
+                if step["step_type"] == "proposal_analysis":
+                    proposal_input = step["input_data"]
+                    break
+            else:
                 return None
             
             # Calculate performance score based on outcome
-            performance_score = self._calculate_performance_score(decision, trace)
+            performance_score = self._calculate_performance_score(decision, score_deltas)
             
             # Build training example
-            input_prompt = self._build_judge_prompt(proposal_step["input_data"], decision["agent_id"])
+            agent_id = decision["agent_id"]
+            input_prompt = self._build_judge_prompt(proposal_input, agent_id)
             expected_output = self._build_judge_expected_output(decision)
             
             return TrainingExample(
                 input_prompt=input_prompt,
                 expected_output=expected_output,
                 context={
-                    "archetype": decision["agent_id"],
-                    "iteration": proposal_step["input_data"].get("iteration", 1),
+                    "archetype": agent_id,
+                    "iteration": proposal_input.get("iteration", 1),
                     "context_id": trace["context_id"]
                 },
                 performance_score=performance_score,
-                archetype=decision["agent_id"],
+                archetype=agent_id,
                 fear_triggers=self._extract_fear_triggers_from_decision(decision),
                 outcome_quality=self._determine_outcome_quality(performance_score),
                 feedback_source="score_improvement"
@@ -127,20 +202,27 @@ class TrainingDataGenerator:
             logger.warning(f"Failed to extract judge example: {e}")
             return None
     
-    async def _extract_refiner_example(self, decision: Dict[str, Any], trace: Dict[str, Any]) -> Optional[TrainingExample]:
+    def _extract_refiner_example(
+        self,
+        decision: Dict[str, Any],
+        trace: Dict[str, Any],
+        score_deltas: List[Tuple[datetime, List[float]]]
+    ) -> Optional[TrainingExample]:
         """Extract refiner training example"""
         
         try:
-            reasoning_chain = decision["reasoning_chain"]
-            refinement_step = next((step for step in reasoning_chain if step["step_type"] == "refinement_strategy"), None)
-            
-            if not refinement_step:
+            for step in decision["reasoning_chain"]:
+                if step["step_type"] == "refinement_strategy":
+                    refinement_step = step
+                    break
+            else:
                 return None
             
             # Get before/after scores to measure improvement
-            score_improvement = self._calculate_score_improvement(decision, trace)
+            score_improvement = self._calculate_score_improvement(decision, score_deltas)
             
-            input_prompt = self._build_refiner_prompt(refinement_step["input_data"])
+            refinement_input = refinement_step["input_data"]
+            input_prompt = self._build_refiner_prompt(refinement_input)
             expected_output = refinement_step["output_data"].get("refined_proposal", "")
             
             return TrainingExample(
@@ -148,7 +230,7 @@ class TrainingDataGenerator:
                 expected_output=expected_output,
                 context={
                     "score_improvement": score_improvement,
-                    "objections_addressed": len(refinement_step["input_data"].get("objections", [])),
+                    "objections_addressed": len(refinement_input.get("objections", [])),
                     "context_id": trace["context_id"]
                 },
                 performance_score=score_improvement,
@@ -162,7 +244,7 @@ class TrainingDataGenerator:
             logger.warning(f"Failed to extract refiner example: {e}")
             return None
     
-    async def _extract_fear_detection_examples(self, trace: Dict[str, Any]) -> List[TrainingExample]:
+    def _extract_fear_detection_examples(self, trace: Dict[str, Any]) -> List[TrainingExample]:
         """Extract fear detection training examples"""
         
         examples = []
@@ -180,7 +262,7 @@ class TrainingDataGenerator:
                 
                 example = TrainingExample(
                     input_prompt=f"Analyze this text for {fear_trigger['judge_archetype']} fears: {input_text}",
-                    expected_output=json.dumps(expected_output),
+                    expected_output=dumps(expected_output).decode(),
                     context={"fear_code": fear_trigger["fear_code"]},
                     performance_score=fear_trigger["intensity"],
                     archetype=fear_trigger["judge_archetype"],
@@ -199,80 +281,79 @@ class TrainingDataGenerator:
     def _is_high_quality_example(self, example: TrainingExample) -> bool:
         """Determine if example meets quality thresholds"""
         
+        # Most rejections fail the outcome check, so test it first
         return (
+            example.outcome_quality in _GOOD_OUTCOMES and
             example.performance_score >= self.min_score_improvement and
             len(example.input_prompt) > 50 and  # Reasonable input length
-            len(example.expected_output) > 20 and  # Reasonable output length
-            example.outcome_quality in ["excellent", "good"]
+            len(example.expected_output) > 20  # Reasonable output length
         )
     
-    def _calculate_performance_score(self, decision: Dict[str, Any], trace: Dict[str, Any]) -> float:
+    def _score_deltas(self, trace: Dict[str, Any]) -> List[Tuple[datetime, List[float]]]:
+        """
+        Score changes from each iteration to the next, as (timestamp of the
+        later iteration, deltas for perspectives scored in both)
+        """
+        
+        score_evolutions = trace["score_evolution"]
+        deltas = []
+        
+        for prev, curr in zip(score_evolutions, score_evolutions[1:]):
+            prev_scores = prev["scores"]
+            curr_scores = curr["scores"]
+            deltas.append((
+                curr["timestamp"],
+                [curr_scores[perspective] - prev_scores[perspective] for perspective in curr_scores if perspective in prev_scores]
+            ))
+        
+        return deltas
+    
+    def _calculate_performance_score(
+        self,
+        decision: Dict[str, Any],
+        score_deltas: List[Tuple[datetime, List[float]]]
+    ) -> float:
         """Calculate how well this decision performed"""
         
         # Look for score improvements after this decision
         decision_time = decision["timestamp"]
         
-        score_evolutions = trace["score_evolution"]
-        improvements = []
-        
-        for i, evolution in enumerate(score_evolutions):
-            if evolution["timestamp"] > decision_time and i > 0:
-                prev_scores = score_evolutions[i-1]["scores"]
-                curr_scores = evolution["scores"]
-                
-                for perspective in curr_scores:
-                    if perspective in prev_scores:
-                        improvement = curr_scores[perspective] - prev_scores[perspective]
-                        improvements.append(improvement)
+        improvements = [
+            improvement
+            for timestamp, step_deltas in score_deltas if timestamp > decision_time
+            for improvement in step_deltas
+        ]
         
         return sum(improvements) / len(improvements) if improvements else 0.0
     
-    def _calculate_score_improvement(self, decision: Dict[str, Any], trace: Dict[str, Any]) -> float:
+    def _calculate_score_improvement(
+        self,
+        decision: Dict[str, Any],
+        score_deltas: List[Tuple[datetime, List[float]]]
+    ) -> float:
         """Calculate score improvement for refinement decisions"""
         
         # Similar to performance score but more focused on refinement outcomes
-        score_evolutions = trace["score_evolution"]
-        
-        if len(score_evolutions) < 2:
+        if not score_deltas:
             return 0.0
         
         # Compare last two iterations
-        final_scores = score_evolutions[-1]["scores"]
-        prev_scores = score_evolutions[-2]["scores"]
-        
-        improvements = []
-        for perspective in final_scores:
-            if perspective in prev_scores:
-                improvement = final_scores[perspective] - prev_scores[perspective]
-                improvements.append(improvement)
+        improvements = score_deltas[-1][1]
         
         return sum(improvements) / len(improvements) if improvements else 0.0
     
     def _extract_fear_triggers_from_decision(self, decision: Dict[str, Any]) -> List[str]:
         """Extract fear codes that influenced this decision"""
         
-        fear_triggers = []
-        for step in decision["reasoning_chain"]:
-            if "fear" in step["reasoning"].lower():
-                # Extract fear-related terms (simplified)
-                fear_triggers.extend([
-                    "technical_debt", "vendor_lock", "budget_risk", 
-                    "compliance_risk", "brand_damage"
-                ])
+        if any(_FEAR_RE.search(step["reasoning"]) for step in decision["reasoning_chain"]):
+            return list(_FEAR_CODES)
         
-        return list(set(fear_triggers))
+        return []
     
     def _determine_outcome_quality(self, performance_score: float) -> str:
         """Categorize outcome quality"""
         
-        if performance_score >= 3.0:
-            return "excellent"
-        elif performance_score >= 1.5:
-            return "good"
-        elif performance_score >= 0.5:
-            return "fair"
-        else:
-            return "poor"
+        return _OUTCOME_QUALITIES[bisect.bisect_right(_OUTCOME_THRESHOLDS, performance_score)]
     
     def _build_judge_prompt(self, input_data: Dict[str, Any], archetype: str) -> str:
         """Build standardized judge prompt for training"""
@@ -330,6 +411,24 @@ class ModelRetrainingOrchestrator:
         self.data_generator = TrainingDataGenerator(config)
         self.performance_tracker = ModelPerformanceTracker()
         
+        # Running total of stored example lines, kept next to the data so
+        # retraining checks don't rescan every file; cached on its mtime
+        self._counts_path = self.data_generator.training_data_path / "counts.json"
+        self._cached_count: Optional[Tuple[int, int]] = None  # (mtime_ns, total)
+        
+        # Fingerprints of every example stored so far, so repeats are skipped;
+        # persisted as packed 64-bit integers
+        self._fingerprints_path = self.data_generator.training_data_path / "fingerprints.bin"
+        self._seen_fingerprints = self._load_fingerprints()
+        self._pending_fingerprints: set = set()  # examples being written right now
+        
+        # Caps evaluations processed concurrently by process_many
+        self.max_parallel_evaluations = config.get("max_parallel_evaluations", 8)
+        self._evaluation_sem = asyncio.Semaphore(self.max_parallel_evaluations)
+        
+        # Retraining runs in the background; triggers while it is in flight coalesce
+        self._retraining_task: Optional[asyncio.Task] = None
+        
         # Retraining thresholds
         self.min_examples_for_retraining = 100
         self.retraining_interval_days = 7
@@ -343,34 +442,103 @@ class ModelRetrainingOrchestrator:
             examples = await self.data_generator.extract_training_data(context_id)
             
             if examples:
-                # Store examples
-                await self._store_training_examples(examples)
-                
-                # Update performance metrics
-                await self.performance_tracker.update_metrics(context_id, examples)
+                # Store examples (thread-offloaded I/O) while metrics update
+                await asyncio.gather(
+                    self._store_training_examples(examples),
+                    self.performance_tracker.update_metrics(context_id, examples)
+                )
                 
                 # Check if retraining is needed
-                if await self._should_trigger_retraining():
-                    await self._trigger_retraining()
+                if self._retraining_task is None or self._retraining_task.done():
+                    if await self._should_trigger_retraining():
+                        self.request_retraining()
                     
         except Exception as e:
             logger.error(f"Failed to process evaluation for training: {e}")
     
+    def request_retraining(self) -> asyncio.Task:
+        """Start the retraining pipeline in the background, unless a run is already in flight"""
+        
+        if self._retraining_task is None or self._retraining_task.done():
+            self._retraining_task = asyncio.create_task(self._trigger_retraining())
+            self._retraining_task.add_done_callback(self._log_retraining_failure)
+        return self._retraining_task
+    
+    @staticmethod
+    def _log_retraining_failure(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Retraining pipeline failed: {task.exception()}")
+    
+    async def process_many(self, context_ids: List[str]):
+        """
+        Process several completed evaluations concurrently
+        Extraction of one context overlaps storage of another, bounded by
+        max_parallel_evaluations
+        """
+        
+        async def process_bounded(context_id: str):
+            async with self._evaluation_sem:
+                await self.process_completed_evaluation(context_id)
+        
+        for finished in asyncio.as_completed([process_bounded(c) for c in context_ids]):
+            await finished
+    
     async def _store_training_examples(self, examples: List[TrainingExample]):
         """Store training examples for later use"""
         
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        # Skip examples identical to one already stored or being stored;
+        # in-flight fingerprints are reserved so concurrent calls don't race
+        fresh: Dict[str, List[Tuple[int, TrainingExample]]] = defaultdict(list)
+        for example in examples:
+            fingerprint = _fingerprint(example.input_prompt, example.expected_output)
+            if fingerprint not in self._seen_fingerprints and fingerprint not in self._pending_fingerprints:
+                self._pending_fingerprints.add(fingerprint)
+                fresh[example.archetype].append((fingerprint, example))
         
-        for archetype in set(ex.archetype for ex in examples):
-            archetype_examples = [ex for ex in examples if ex.archetype == archetype]
-            
-            file_path = self.data_generator.training_data_path / f"{archetype}_{timestamp}.jsonl"
-            
-            with open(file_path, 'w') as f:
-                for example in archetype_examples:
-                    f.write(json.dumps(asdict(example)) + '\n')
-            
-            logger.info(f"Stored {len(archetype_examples)} examples for {archetype}")
+        if not fresh:
+            return
+        
+        # One append-only shard per archetype per day
+        day = datetime.utcnow().strftime("%Y%m%d")
+        
+        try:
+            for archetype, entries in fresh.items():
+                file_path = self.data_generator.training_data_path / f"{archetype}_{day}.jsonl"
+                
+                # File I/O (and the counts.json lock) stay off the event loop
+                await asyncio.to_thread(self._write_and_count_examples, file_path, [example for _, example in entries])
+                
+                # Only a written shard's examples count as stored, so a failed
+                # write is retried later and a restart doesn't store them twice
+                new_fingerprints = array('Q', (fingerprint for fingerprint, _ in entries))
+                self._seen_fingerprints.update(new_fingerprints)
+                await asyncio.to_thread(self._append_fingerprints, new_fingerprints)
+                
+                logger.info(f"Stored {len(entries)} examples for {archetype}")
+        finally:
+            for entries in fresh.values():
+                self._pending_fingerprints.difference_update(fingerprint for fingerprint, _ in entries)
+    
+    def _load_fingerprints(self) -> set:
+        """Load the fingerprints of previously stored examples"""
+        
+        fingerprints = array('Q')
+        try:
+            with open(self._fingerprints_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return set()
+        
+        # Ignore a trailing partial record left by an interrupted append
+        fingerprints.frombytes(data[:len(data) - len(data) % fingerprints.itemsize])
+        return set(fingerprints)
+    
+    def _append_fingerprints(self, fingerprints: array):
+        """Persist fingerprints of newly stored examples (blocking; run in a thread)"""
+        
+        with open(self._fingerprints_path, 'ab') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.write(fingerprints.tobytes())
     
     async def _should_trigger_retraining(self) -> bool:
         """Determine if retraining should be triggered"""
@@ -409,31 +577,52 @@ class ModelRetrainingOrchestrator:
     async def _prepare_retraining_dataset(self):
         """Prepare consolidated dataset for retraining"""
         
-        all_examples = []
-        
-        # Collect all recent training examples
-        for file_path in self.data_generator.training_data_path.glob("*.jsonl"):
-            with open(file_path, 'r') as f:
-                for line in f:
-                    example_data = json.loads(line)
-                    all_examples.append(TrainingExample(**example_data))
-        
-        # Split by archetype and quality
-        datasets = {
-            "high_quality": [ex for ex in all_examples if ex.outcome_quality in ["excellent", "good"]],
-            "fear_detection": [ex for ex in all_examples if ex.feedback_source == "fear_detection"],
-            "refinement": [ex for ex in all_examples if ex.archetype == "refiner"]
-        }
+        # Collect all recent training examples, reading files in worker threads
+        # and splitting by archetype and quality as they are read. Threads, not
+        # processes: this runs beside the event bus's persist threads, where
+        # forking is unsafe, and spawned workers cannot import this module
+        # from the hyphenated service directory
+        file_paths = list(self.data_generator.training_data_path.glob("*.jsonl"))
+        datasets: Dict[str, List[TrainingExample]] = {name: [] for name in _DATASET_FILTERS}
+        
+        if file_paths:
+            partitioned_files = await asyncio.gather(*(
+                asyncio.to_thread(_partition_training_file, file_path)
+                for file_path in file_paths
+            ))
+            
+            # Shards and earlier consolidated files overlap; keep each example once
+            seen: Dict[str, set] = {name: set() for name in _DATASET_FILTERS}
+            for partitions in partitioned_files:
+                for name, rows in partitions.items():
+                    dataset, dataset_seen = datasets[name], seen[name]
+                    for fingerprint, example_data in rows:
+                        if fingerprint not in dataset_seen:
+                            dataset_seen.add(fingerprint)
+                            dataset.append(TrainingExample(**example_data))
         
         # Save consolidated datasets
         for dataset_name, examples in datasets.items():
             output_path = self.data_generator.training_data_path / f"consolidated_{dataset_name}.jsonl"
             
-            with open(output_path, 'w') as f:
-                for example in examples:
-                    f.write(json.dumps(asdict(example)) + '\n')
+            await asyncio.to_thread(self._write_examples, output_path, examples)
             
             logger.info(f"Prepared {len(examples)} examples for {dataset_name} retraining")
+        
+        # Consolidated files were rewritten wholesale; recount from disk
+        await asyncio.to_thread(self._recount_stored_examples)
+    
+    def _write_examples(self, file_path: Path, examples: List[TrainingExample], append: bool = False):
+        """Write examples to a JSONL file, replacing it or appending to it (blocking; run in a thread)"""
+        
+        # Encode everything up front and hand the file one buffer
+        payload = b''.join([dumps(example) + b'\n' for example in examples])
+        
+        with open(file_path, 'ab' if append else 'wb') as f:
+            if append:
+                # Other processes may be appending to the same daily shard
+                fcntl.flock(f, fcntl.LOCK_EX)
+            f.write(payload)
     
     async def _notify_retraining_required(self):
         """Notify that retraining is required"""
@@ -442,22 +631,97 @@ class ModelRetrainingOrchestrator:
         logger.info("Retraining notification sent - dataset ready for ML pipeline")
         
         # Store retraining trigger
-        with open(self.data_generator.training_data_path / "retraining_log.json", 'a') as f:
-            log_entry = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "trigger_reason": "performance_degradation",
-                "examples_count": await self._count_stored_examples()
-            }
-            f.write(json.dumps(log_entry) + '\n')
+        log_entry = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "trigger_reason": "performance_degradation",
+            "examples_count": await self._count_stored_examples()
+        }
+        await asyncio.to_thread(self._append_retraining_log, log_entry)
+    
+    def _append_retraining_log(self, log_entry: Dict[str, Any]):
+        """Append an entry to the retraining log (blocking; run in a thread)"""
+        
+        with open(self.data_generator.training_data_path / "retraining_log.json", 'ab') as f:
+            f.write(dumps(log_entry) + b'\n')
     
     async def _count_stored_examples(self) -> int:
         """Count total stored training examples"""
         
+        try:
+            mtime_ns = self._counts_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # First run (or counts.json removed): build it from the files
+            return await asyncio.to_thread(self._recount_stored_examples)
+        
+        if self._cached_count and self._cached_count[0] == mtime_ns:
+            return self._cached_count[1]
+        
+        # The shared lock can wait behind a recount or shard append; off the loop
+        total = await asyncio.to_thread(self._read_stored_count)
+        if total is None:
+            return await asyncio.to_thread(self._recount_stored_examples)
+        
+        self._cached_count = (mtime_ns, total)
+        return total
+    
+    def _read_stored_count(self) -> Optional[int]:
+        """Read counts.json under a shared lock (blocking; run in a thread)"""
+        
+        with open(self._counts_path, 'r') as f:
+            fcntl.flock(f, fcntl.LOCK_SH)
+            content = f.read()
+        
+        return json.loads(content)["total_examples"] if content else None
+    
+    def _scan_stored_examples(self) -> int:
+        """Count example lines by reading every stored JSONL file"""
+        
         total = 0
         for file_path in self.data_generator.training_data_path.glob("*.jsonl"):
-            with open(file_path, 'r') as f:
-                total += sum(1 for _ in f)
+            # Count newlines in raw 1 MiB chunks; no decoding or per-line objects
+            last_chunk = b""
+            with open(file_path, 'rb', buffering=0) as f:
+                while chunk := f.read(1 << 20):
+                    total += chunk.count(b'\n')
+                    last_chunk = chunk
+            
+            # A final line without a trailing newline still counts
+            if last_chunk and not last_chunk.endswith(b'\n'):
+                total += 1
+        
+        return total
+    
+    def _recount_stored_examples(self) -> int:
+        """Rebuild counts.json from a full scan"""
+        return self._update_stored_count(lambda stored: self._scan_stored_examples())
+    
+    def _write_and_count_examples(self, file_path: Path, examples: List[TrainingExample]):
+        """Write new examples and add them to the stored count"""
         
+        def update(stored: Optional[int]) -> int:
+            # Written under the counts lock so a concurrent first-run scan
+            # can't pick up these lines and then have them added again
+            self._write_examples(file_path, examples, append=True)
+            # Without a stored count yet, a scan already includes the new lines
+            return self._scan_stored_examples() if stored is None else stored + len(examples)
+        
+        self._update_stored_count(update)
+    
+    def _update_stored_count(self, update) -> int:
+        """Read-modify-write counts.json under an exclusive lock, returning the new total"""
+        
+        fd = os.open(self._counts_path, os.O_RDWR | os.O_CREAT, 0o644)
+        with os.fdopen(fd, 'r+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            content = f.read()
+            stored = json.loads(content)["total_examples"] if content else None
+            
+            total = update(stored)
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps({"total_examples": total}))
+        
+        self._cached_count = (self._counts_path.stat().st_mtime_ns, total)
         return total
     
     async def _get_last_retraining_time(self) -> datetime:
@@ -471,7 +735,7 @@ class ModelRetrainingOrchestrator:
         with open(log_file, 'r') as f:
             lines = f.readlines()
             if lines:
-                last_entry = json.loads(lines[-1])
+                last_entry = loads(lines[-1])
                 return datetime.fromisoformat(last_entry["timestamp"])
         
         return datetime.utcnow() - timedelta(days=30)
@@ -479,17 +743,18 @@ class ModelRetrainingOrchestrator:
 class ModelPerformanceTracker:
     """Tracks model performance metrics over time"""
     
-    def __init__(self):
-        self.metrics_history: Dict[str, List[ModelPerformanceMetrics]] = {}
+    def __init__(self, history_limit: int = 1024):
+        # Only the most recent snapshots per archetype are kept in memory
+        self.history_limit = history_limit
+        self.metrics_history: Dict[str, Deque[ModelPerformanceMetrics]] = {}
     
     async def update_metrics(self, context_id: str, examples: List[TrainingExample]):
         """Update performance metrics based on new examples"""
         
-        for archetype in set(ex.archetype for ex in examples):
-            archetype_examples = [ex for ex in examples if ex.archetype == archetype]
-            
+        for archetype, archetype_examples in _group_by_archetype(examples).items():
             # Calculate metrics
-            accuracy = sum(1 for ex in archetype_examples if ex.outcome_quality in ["excellent", "good"]) / len(archetype_examples)
+            successful = sum(1 for ex in archetype_examples if ex.outcome_quality in _GOOD_OUTCOMES)
+            accuracy = successful / len(archetype_examples)
             avg_performance = sum(ex.performance_score for ex in archetype_examples) / len(archetype_examples)
             
             metrics = ModelPerformanceMetrics(
@@ -501,11 +766,11 @@ class ModelPerformanceTracker:
                 confidence_calibration=self._calculate_confidence_calibration(archetype_examples),
                 fear_detection_accuracy=self._calculate_fear_accuracy(archetype_examples),
                 total_evaluations=len(archetype_examples),
-                successful_outcomes=sum(1 for ex in archetype_examples if ex.outcome_quality in ["excellent", "good"])
+                successful_outcomes=successful
             )
             
             if archetype not in self.metrics_history:
-                self.metrics_history[archetype] = []
+                self.metrics_history[archetype] = deque(maxlen=self.history_limit)
             
             self.metrics_history[archetype].append(metrics)
     
@@ -526,9 +791,7 @@ class ModelPerformanceTracker:
         if len(examples) < 2:
             return 1.0
         
-        scores = [ex.performance_score for ex in examples]
-        mean_score = sum(scores) / len(scores)
-        variance = sum((score - mean_score) ** 2 for score in scores) / len(scores)
+        variance = pvariance([ex.performance_score for ex in examples])
         
         # Lower variance = higher consistency
         return max(0.0, 1.0 - variance / 10.0)
@@ -548,7 +811,7 @@ class ModelPerformanceTracker:
         if not fear_examples:
             return 1.0
         
-        accurate = sum(1 for ex in fear_examples if ex.outcome_quality in ["excellent", "good"])
+        accurate = sum(1 for ex in fear_examples if ex.outcome_quality in _GOOD_OUTCOMES)
         return accurate / len(fear_examples)
 
 # Global instances
@@ -4,23 +4,27 @@ Vertical Deployment System - Agentius as a Service
 
 Deploy specialized Agentius instances for different verticals (education, health, 
 logistics) with pre-loaded context and industry-specific configurations.
+
+docker and yaml are imported where they are used, so reading vertical
+configurations doesn't pay for loading the Docker SDK.
 """
 
 import asyncio
-import yaml
-import docker
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime
-from pathlib import Path
-import json
+import hashlib
+import io
+import tarfile
+import time
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
 import subprocess
 
 from ..utils.logger import setup_logger
+from ..utils.serialization import dumps
 
 logger = setup_logger(__name__)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VerticalConfig:
     """Configuration for a vertical-specific deployment"""
     vertical: str
@@ -33,8 +37,23 @@ class VerticalConfig:
     decision_makers: List[str]
     common_objections: List[str]
     success_metrics: Dict[str, str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize without asdict's deep copy; nested values are shared, not copied"""
+        return {
+            "vertical": self.vertical,
+            "industry_context": self.industry_context,
+            "judge_archetypes": self.judge_archetypes,
+            "fear_code_overrides": self.fear_code_overrides,
+            "custom_prompts": self.custom_prompts,
+            "compliance_requirements": self.compliance_requirements,
+            "typical_deal_sizes": self.typical_deal_sizes,
+            "decision_makers": self.decision_makers,
+            "common_objections": self.common_objections,
+            "success_metrics": self.success_metrics
+        }
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeploymentSpec:
     """Specification for a deployment"""
     deployment_id: str
@@ -47,11 +66,46 @@ class DeploymentSpec:
     scaling: Dict[str, Any]
     monitoring: Dict[str, Any]
 
+def _tar_build_context(files: Dict[str, str]) -> io.BytesIO:
+    """Pack build files (name -> content) into an in-memory tar build context"""
+    
+    context = io.BytesIO()
+    with tarfile.open(fileobj=context, mode="w") as tar:
+        for name, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    
+    context.seek(0)
+    return context
+
+def _build_context_digest(files: Dict[str, str], base_image_id: str) -> str:
+    """
+    Short SHA-256 over a build context's file names and contents and the
+    resolved base image, so a moved base tag yields a new image tag
+    """
+    
+    digest = hashlib.sha256(base_image_id.encode() + b"\0")
+    for name in sorted(files):
+        digest.update(name.encode() + b"\0" + files[name].encode() + b"\0")
+    return digest.hexdigest()[:16]
+
 class VerticalConfigManager:
     """Manages vertical-specific configurations"""
     
     def __init__(self):
         self.verticals = self._define_vertical_configs()
+        
+        # Plain-dict form and image build files per vertical, built once up front
+        self.config_dicts = {
+            vertical: vertical_config.to_dict()
+            for vertical, vertical_config in self.verticals.items()
+        }
+        self.config_files = {
+            vertical: self._serialize_config_files(vertical_config)
+            for vertical, vertical_config in self.verticals.items()
+        }
     
     def _define_vertical_configs(self) -> Dict[str, VerticalConfig]:
         """Define configurations for different verticals"""
@@ -218,23 +272,87 @@ class VerticalConfigManager:
             )
         }
     
+    def _serialize_config_files(self, vertical_config: VerticalConfig) -> Dict[str, str]:
+        """Render the JSON config files copied into a vertical's image"""
+        
+        # Only the container reads these, so they are written compactly
+        return {
+            "vertical_config.json": dumps(self.config_dicts[vertical_config.vertical]).decode(),
+            "custom_prompts.json": dumps(vertical_config.custom_prompts).decode(),
+            "compliance_config.json": dumps({
+                "requirements": vertical_config.compliance_requirements,
+                "fear_overrides": vertical_config.fear_code_overrides
+            }).decode()
+        }
+    
     def get_vertical_config(self, vertical: str) -> Optional[VerticalConfig]:
         """Get configuration for a specific vertical"""
         return self.verticals.get(vertical)
     
+    def get_config_dict(self, vertical: str) -> Dict[str, Any]:
+        """Get a vertical's configuration as a plain dict (shared; treat as read-only)"""
+        return self.config_dicts[vertical]
+    
+    def get_config_files(self, vertical: str) -> Dict[str, str]:
+        """Get the serialized config files (file name -> content) for a vertical"""
+        return self.config_files[vertical]
+    
     def list_available_verticals(self) -> List[str]:
         """List all available verticals"""
         return list(self.verticals.keys())
 
+# Vertical configurations are static; build them once per process
+global_vertical_configs = VerticalConfigManager()
+
 class ContainerizedDeployer:
     """Handles containerized deployments of Agentius instances"""
     
+    _DOCKERFILE_TEMPLATE = """
+FROM {base_image}:latest
+
+# Copy vertical configuration
+COPY vertical_config.json /app/config/vertical_config.json
+COPY custom_prompts.json /app/config/custom_prompts.json
+COPY compliance_config.json /app/config/compliance_config.json
+
+# Set environment variables
+ENV AGENTIUS_VERTICAL={vertical}
+ENV AGENTIUS_MODE=vertical
+
+# Override default configuration
+COPY agentius_config.yaml /app/config/agentius_config.yaml
+
+# Health check
+HEALTHCHECK --interval=30s --timeout=10s --start-period=60s --retries=3 \\
+    CMD curl -f http://localhost:8000/health || exit 1
+
+EXPOSE 8000
+CMD ["python", "main.py", "--vertical-mode"]
+"""
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        import docker
         self.docker_client = docker.from_env()
         self.registry_url = config.get("registry_url", "localhost:5000")
         self.base_image = config.get("base_image", "agentius/proposal-evaluator")
         
+        # Host ports come from a fixed range below the kernel's ephemeral range,
+        # so outbound connections never take a port between probe and bind
+        port_start, port_end = config.get("port_range", (8100, 8200))
+        self._port_range = range(port_start, port_end)
+        
+        # deployment_id -> host port handed out by this deployer, so concurrent
+        # deploys never share one; released on removal or failed deploys
+        self._deployment_ports: Dict[str, int] = {}
+        
+        # Shared HTTP client for health checks, created on first use
+        self._http_client = None
+        
+        # vertical -> build context files; these depend only on the vertical
+        # and this deployer's base image name
+        self._build_contexts: Dict[str, Dict[str, str]] = {}
+        
     async def deploy_vertical_instance(
         self, 
         vertical: str,
@@ -248,8 +366,7 @@ class ContainerizedDeployer:
         deployment_id = f"agentius-{vertical}-{client_id}-{environment}"
         
         # Get vertical configuration
-        config_manager = VerticalConfigManager()
-        vertical_config = config_manager.get_vertical_config(vertical)
+        vertical_config = global_vertical_configs.get_vertical_config(vertical)
         
         if not vertical_config:
             raise ValueError(f"Unknown vertical: {vertical}")
@@ -269,19 +386,25 @@ class ContainerizedDeployer:
         
         try:
             # Build custom image with vertical configuration
-            image_tag = await self._build_vertical_image(vertical_config, deployment_id)
+            # Dev deployments run the locally built image without a registry round trip
+            image_tag = await self._build_vertical_image(
+                vertical_config, deployment_id, push=environment != "dev"
+            )
             
             # Deploy container
             container = await self._deploy_container(deployment_spec, image_tag, custom_config)
             
-            # Setup networking
-            await self._setup_networking(container, deployment_spec)
-            
-            # Configure monitoring
-            await self._setup_monitoring(container, deployment_spec)
-            
-            # Perform health checks
-            health_status = await self._perform_health_checks(container, deployment_spec)
+            # Setup networking, configure monitoring and perform health checks;
+            # health checks hit the container port directly, so all three overlap.
+            # A failure cancels the other two before cleanup removes the container
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._setup_networking(container, deployment_spec))
+                    tg.create_task(self._setup_monitoring(container, deployment_spec))
+                    health_check = tg.create_task(self._perform_health_checks(container, deployment_spec))
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0]
+            health_status = health_check.result()
             
             logger.info(f"Successfully deployed {deployment_id}")
             
@@ -295,7 +418,7 @@ class ContainerizedDeployer:
                     "webhook": f"https://{deployment_spec.networking['domain']}/webhook",
                     "health": f"https://{deployment_spec.networking['domain']}/health"
                 },
-                "vertical_config": asdict(vertical_config),
+                "vertical_config": global_vertical_configs.get_config_dict(vertical),
                 "health_status": health_status,
                 "deployed_at": datetime.utcnow().isoformat()
             }
@@ -305,106 +428,160 @@ class ContainerizedDeployer:
             await self._cleanup_failed_deployment(deployment_id)
             raise
     
-    async def _build_vertical_image(self, vertical_config: VerticalConfig, deployment_id: str) -> str:
+    async def deploy_many(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Deploy several vertical instances concurrently
+        Each spec holds the keyword arguments of deploy_vertical_instance
+        """
+        
+        return await asyncio.gather(*(
+            self.deploy_vertical_instance(**spec) for spec in specs
+        ))
+    
+    async def _build_vertical_image(
+        self,
+        vertical_config: VerticalConfig,
+        deployment_id: str,
+        push: bool = True
+    ) -> str:
         """Build Docker image with vertical-specific configuration"""
         
-        # Create temporary directory for build context
-        build_dir = Path(f"/tmp/agentius_build_{deployment_id}")
-        build_dir.mkdir(exist_ok=True)
+        build_files = self._get_build_context(vertical_config)
         
-        try:
-            # Create Dockerfile
-            dockerfile_content = f"""
-FROM {self.base_image}:latest
-
-# Copy vertical configuration
-COPY vertical_config.json /app/config/vertical_config.json
-COPY custom_prompts.json /app/config/custom_prompts.json
-COPY compliance_config.json /app/config/compliance_config.json
-
-# Set environment variables
-ENV AGENTIUS_VERTICAL={vertical_config.vertical}
-ENV AGENTIUS_MODE=vertical
-
-# Override default configuration
-COPY agentius_config.yaml /app/config/agentius_config.yaml
-
-# Health check
-HEALTHCHECK --interval=30s --timeout=10s --start-period=60s --retries=3 \\
-    CMD curl -f http://localhost:8000/health || exit 1
-
-EXPOSE 8000
-CMD ["python", "main.py", "--vertical-mode"]
-"""
-            
-            (build_dir / "Dockerfile").write_text(dockerfile_content)
-            
-            # Create configuration files
-            (build_dir / "vertical_config.json").write_text(
-                json.dumps(asdict(vertical_config), indent=2)
-            )
-            
-            (build_dir / "custom_prompts.json").write_text(
-                json.dumps(vertical_config.custom_prompts, indent=2)
-            )
-            
-            (build_dir / "compliance_config.json").write_text(
-                json.dumps({
-                    "requirements": vertical_config.compliance_requirements,
-                    "fear_overrides": vertical_config.fear_code_overrides
-                }, indent=2)
-            )
-            
-            # Create main configuration
-            agentius_config = {
-                "vertical": vertical_config.vertical,
-                "judge_archetypes": vertical_config.judge_archetypes,
-                "industry_context": vertical_config.industry_context,
-                "llm": {
-                    "provider": "openai",
-                    "model": "gpt-4",
-                    "temperature": 0.2
-                },
-                "database": {
-                    "provider": "supabase",
-                    "connection_string": "${SUPABASE_CONNECTION_STRING}"
-                },
-                "monitoring": {
-                    "enabled": True,
-                    "metrics_endpoint": "/metrics"
-                }
+        # The docker SDK blocks; keep lookups, build and push off the event loop
+        base_image_id, pull_base = await asyncio.to_thread(self._resolve_base_image)
+        
+        # The image is a pure function of its build context and base image, so
+        # it is tagged with a content hash and only built when that tag doesn't
+        # exist yet; a moved base `latest` changes the hash and forces a rebuild
+        repository = f"{self.registry_url}/agentius-{vertical_config.vertical}"
+        content_tag = f"{repository}:{_build_context_digest(build_files, base_image_id)}"
+        image_tag = f"{repository}:{deployment_id}"
+        
+        image = await asyncio.to_thread(
+            self._get_or_build_image, content_tag, build_files, push, pull_base
+        )
+        
+        # Tag for this deployment and push to registry
+        await asyncio.to_thread(image.tag, repository, deployment_id)
+        if push:
+            await asyncio.to_thread(self.docker_client.images.push, image_tag)
+            logger.info(f"Pushed image: {image_tag}")
+        
+        return image_tag
+    
+    def _get_build_context(self, vertical_config: VerticalConfig) -> Dict[str, str]:
+        """Get the image build context files for a vertical, rendering them once"""
+        
+        cached = self._build_contexts.get(vertical_config.vertical)
+        if cached is not None:
+            return cached
+        
+        # Create Dockerfile
+        dockerfile_content = self._DOCKERFILE_TEMPLATE.format(
+            base_image=self.base_image,
+            vertical=vertical_config.vertical
+        )
+        
+        # libyaml's C emitter when PyYAML was built with it
+        import yaml
+        yaml_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        
+        # Create main configuration
+        agentius_config = {
+            "vertical": vertical_config.vertical,
+            "judge_archetypes": vertical_config.judge_archetypes,
+            "industry_context": vertical_config.industry_context,
+            "llm": {
+                "provider": "openai",
+                "model": "gpt-4",
+                "temperature": 0.2
+            },
+            "database": {
+                "provider": "supabase",
+                "connection_string": "${SUPABASE_CONNECTION_STRING}"
+            },
+            "monitoring": {
+                "enabled": True,
+                "metrics_endpoint": "/metrics"
             }
-            
-            (build_dir / "agentius_config.yaml").write_text(
-                yaml.dump(agentius_config, indent=2)
-            )
-            
-            # Build image
-            image_tag = f"{self.registry_url}/agentius-{vertical_config.vertical}:{deployment_id}"
-            
-            self.docker_client.images.build(
-                path=str(build_dir),
-                tag=image_tag,
-                rm=True
-            )
-            
-            # Push to registry
-            self.docker_client.images.push(image_tag)
-            
-            logger.info(f"Built and pushed image: {image_tag}")
-            return image_tag
-            
-        finally:
-            # Cleanup build directory
-            import shutil
-            shutil.rmtree(build_dir, ignore_errors=True)
+        }
+        
+        # Assemble the build context (Dockerfile plus configuration files)
+        build_files = {
+            "Dockerfile": dockerfile_content,
+            **global_vertical_configs.get_config_files(vertical_config.vertical),
+            "agentius_config.yaml": yaml.dump(agentius_config, Dumper=yaml_dumper, indent=2, default_flow_style=False)
+        }
+        
+        self._build_contexts[vertical_config.vertical] = build_files
+        return build_files
+    
+    def _resolve_base_image(self) -> Tuple[str, bool]:
+        """
+        Identify the current base image: its registry digest when the registry
+        is reachable, else the local image id. Also returns whether a build
+        must pull the base to match that identity.
+        """
+        
+        import docker
+        
+        base_tag = f"{self.base_image}:latest"
+        try:
+            return self.docker_client.images.get_registry_data(base_tag).id, True
+        except docker.errors.APIError:
+            pass
+        
+        try:
+            return self.docker_client.images.get(base_tag).id, False
+        except docker.errors.ImageNotFound:
+            # Unknown anywhere; the build below will report it
+            return base_tag, True
+    
+    def _get_or_build_image(
+        self,
+        content_tag: str,
+        build_files: Dict[str, str],
+        push: bool = True,
+        pull_base: bool = False
+    ):
+        """Find the image for a build context locally or in the registry, building (and pushing) it if missing"""
+        
+        import docker
+        
+        try:
+            return self.docker_client.images.get(content_tag)
+        except docker.errors.ImageNotFound:
+            pass
+        
+        try:
+            self.docker_client.images.get_registry_data(content_tag)
+            logger.info(f"Pulling existing image: {content_tag}")
+            return self.docker_client.images.pull(content_tag)
+        except docker.errors.APIError:
+            pass
+        
+        image, _ = self.docker_client.images.build(
+            fileobj=_tar_build_context(build_files),
+            custom_context=True,
+            tag=content_tag,
+            pull=pull_base,
+            rm=True
+        )
+        logger.info(f"Built image: {content_tag}")
+        
+        if push:
+            self.docker_client.images.push(content_tag)
+            logger.info(f"Pushed image: {content_tag}")
+        
+        return image
     
     async def _deploy_container(
         self, 
         deployment_spec: DeploymentSpec, 
         image_tag: str,
         custom_config: Optional[Dict[str, Any]] = None
-    ) -> docker.models.containers.Container:
+    ) -> "docker.models.containers.Container":
         """Deploy the container"""
         
         # Environment variables
@@ -446,8 +623,9 @@ CMD ["python", "main.py", "--vertical-mode"]
             "detach": True
         }
         
-        # Deploy container
-        container = self.docker_client.containers.run(**container_config)
+        # Deploy container; create and start block on the Docker API, so
+        # concurrent deploys (deploy_many) keep running meanwhile
+        container = await asyncio.to_thread(self.docker_client.containers.run, **container_config)
         
         logger.info(f"Container deployed: {container.id}")
         return container
@@ -467,7 +645,7 @@ CMD ["python", "main.py", "--vertical-mode"]
         """Get networking specifications"""
         
         return {
-            "port": self._get_available_port(),
+            "port": self._get_available_port(deployment_id),
             "domain": f"{deployment_id}.agentius.local",
             "ssl_enabled": True,
             "load_balancer": True
@@ -507,22 +685,36 @@ CMD ["python", "main.py", "--vertical-mode"]
             }
         }
     
-    def _get_available_port(self) -> int:
-        """Get an available port for the deployment"""
+    def _get_available_port(self, deployment_id: str) -> int:
+        """Reserve a free host port in the configured range for the deployment"""
         
-        # Simple port allocation - in production, use a proper port manager
         import socket
         
-        for port in range(8100, 8200):
+        if deployment_id in self._deployment_ports:
+            return self._deployment_ports[deployment_id]
+        
+        reserved = set(self._deployment_ports.values())
+        for port in self._port_range:
+            if port in reserved:
+                continue
+            
+            # Ports published by running containers, including those of
+            # earlier processes, are held by Docker and fail this probe
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 try:
                     s.bind(('', port))
-                    return port
                 except OSError:
                     continue
+            
+            self._deployment_ports[deployment_id] = port
+            return port
         
         raise RuntimeError("No available ports")
     
+    def _release_port(self, deployment_id: str):
+        """Return a deployment's host port to the pool"""
+        self._deployment_ports.pop(deployment_id, None)
+    
     async def _setup_networking(self, container, deployment_spec: DeploymentSpec):
         """Setup networking for the deployment"""
         
@@ -548,53 +740,68 @@ CMD ["python", "main.py", "--vertical-mode"]
     async def _perform_health_checks(self, container, deployment_spec: DeploymentSpec) -> Dict[str, Any]:
         """Perform initial health checks"""
         
-        # Wait for container to be ready
-        await asyncio.sleep(10)
-        
-        # Check container status
-        container.reload()
+        # Wait for container to be ready: poll the API with backoff for up
+        # to 10s instead of always sleeping the full 10s
+        deadline = time.monotonic() + 10
+        delay = 0.1
+        while True:
+            api_responsive = await self._check_api_health(deployment_spec, log_failure=False)
+            remaining = deadline - time.monotonic()
+            if api_responsive or remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 1.0)
+        
+        if not api_responsive:
+            logger.warning(f"API for {deployment_spec.deployment_id} not responding after 10s")
+        
+        # Check container status with a single inspect, read straight from its payload
+        attrs = await asyncio.to_thread(self.docker_client.api.inspect_container, container.id)
+        container_status = attrs["State"]["Status"]
         
         health_status = {
-            "container_status": container.status,
-            "health_check": "healthy" if container.status == "running" else "unhealthy",
-            "api_responsive": await self._check_api_health(deployment_spec),
+            "container_status": container_status,
+            "health_check": "healthy" if container_status == "running" else "unhealthy",
+            "api_responsive": api_responsive,
             "database_connection": "connected",  # Would check actual DB
             "timestamp": datetime.utcnow().isoformat()
         }
         
         return health_status
     
-    async def _check_api_health(self, deployment_spec: DeploymentSpec) -> bool:
+    async def _check_api_health(self, deployment_spec: DeploymentSpec, log_failure: bool = True) -> bool:
         """Check if API is responding"""
         
         try:
-            import httpx
+            if self._http_client is None:
+                import httpx
+                self._http_client = httpx.AsyncClient(timeout=10)
             
             url = f"http://localhost:{deployment_spec.networking['port']}/health"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10)
-                return response.status_code == 200
+            response = await self._http_client.get(url)
+            return response.status_code == 200
                 
         except Exception as e:
-            logger.warning(f"Health check failed: {e}")
+            if log_failure:
+                logger.warning(f"Health check failed: {e}")
             return False
     
     async def _cleanup_failed_deployment(self, deployment_id: str):
         """Cleanup resources from failed deployment"""
         
+        import docker
+        
         try:
-            # Remove container if it exists
+            # Remove container if it exists (by name, without inspecting it first)
             try:
-                container = self.docker_client.containers.get(deployment_id)
-                container.remove(force=True)
+                await asyncio.to_thread(self.docker_client.api.remove_container, deployment_id, force=True)
             except docker.errors.NotFound:
                 pass
             
             # Remove volume if it exists
             try:
-                volume = self.docker_client.volumes.get(f"agentius_data_{deployment_id}")
-                volume.remove()
+                await asyncio.to_thread(self.docker_client.api.remove_volume, f"agentius_data_{deployment_id}")
             except docker.errors.NotFound:
                 pass
             
@@ -602,27 +809,47 @@ CMD ["python", "main.py", "--vertical-mode"]
             
         except Exception as e:
             logger.error(f"Cleanup failed for {deployment_id}: {e}")
+        
+        finally:
+            self._release_port(deployment_id)
+    
+    async def aclose(self):
+        """Close the shared health-check HTTP client"""
+        
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     async def list_deployments(self) -> List[Dict[str, Any]]:
         """List all Agentius deployments"""
         
-        containers = self.docker_client.containers.list(
+        # One low-level list call returns every field needed; the high-level
+        # containers.list() would inspect each container separately
+        containers = await asyncio.to_thread(
+            self.docker_client.api.containers,
             filters={"label": "agentius.deployment_id"}
         )
         
         deployments = []
         
         for container in containers:
-            labels = container.labels
+            labels = container["Labels"]
+            
+            # Same shape as the inspect data: {"8000/tcp": [{"HostIp", "HostPort"}]}
+            ports: Dict[str, Any] = {}
+            for port in container["Ports"]:
+                bindings = ports.setdefault(f"{port['PrivatePort']}/{port['Type']}", [])
+                if "PublicPort" in port:
+                    bindings.append({"HostIp": port.get("IP", ""), "HostPort": str(port["PublicPort"])})
             
             deployments.append({
                 "deployment_id": labels.get("agentius.deployment_id"),
                 "vertical": labels.get("agentius.vertical"),
                 "client_id": labels.get("agentius.client_id"),
                 "environment": labels.get("agentius.environment"),
-                "status": container.status,
-                "created": container.attrs["Created"],
-                "ports": container.ports
+                "status": container["State"],
+                "created": datetime.fromtimestamp(container["Created"], timezone.utc).replace(tzinfo=None).isoformat() + "Z",
+                "ports": {port: bindings or None for port, bindings in ports.items()}
             })
         
         return deployments
@@ -662,19 +889,20 @@ CMD ["python", "main.py", "--vertical-mode"]
     async def remove_deployment(self, deployment_id: str) -> Dict[str, Any]:
         """Remove a deployment"""
         
+        import docker
+        
         try:
-            # Stop and remove container
-            container = self.docker_client.containers.get(deployment_id)
-            container.stop()
-            container.remove()
+            # Stop and remove container (by name, without inspecting it first)
+            await asyncio.to_thread(self.docker_client.api.stop, deployment_id)
+            await asyncio.to_thread(self.docker_client.api.remove_container, deployment_id)
             
             # Remove volume
             try:
-                volume = self.docker_client.volumes.get(f"agentius_data_{deployment_id}")
-                volume.remove()
+                await asyncio.to_thread(self.docker_client.api.remove_volume, f"agentius_data_{deployment_id}")
             except docker.errors.NotFound:
                 pass
             
+            self._release_port(deployment_id)
             logger.info(f"Removed deployment: {deployment_id}")
             
             return {
@@ -684,6 +912,7 @@ CMD ["python", "main.py", "--vertical-mode"]
             }
             
         except docker.errors.NotFound:
+            self._release_port(deployment_id)
             return {
                 "deployment_id": deployment_id,
                 "status": "not_found",
@@ -728,4 +957,24 @@ async def deploy_vertical_cli(
         
     except Exception as e:
         print(f"❌ Deployment failed: {e}")
-        raise
\ No newline at end of file
+        raise
+    
+    finally:
+        await deployer.aclose()
+
+def run_deploy_vertical_cli(
+    vertical: str,
+    client_id: str,
+    environment: str = "prod"
+) -> Dict[str, Any]:
+    """Synchronous entry point for deploy_vertical_cli, on uvloop when it is installed"""
+    
+    # Deploys are socket-bound (Docker API, registry, health checks); uvloop
+    # is optional, and only this run's loop uses it (no global policy change)
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(deploy_vertical_cli(vertical, client_id, environment))
+    
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(deploy_vertical_cli(vertical, client_id, environment))
@@ -8,7 +8,6 @@ Automatically generates project manifests and launches evaluation cycles.
 
 import asyncio
 import re
-import json
 from typing import Dict, Any, List, Optional, Union, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -28,17 +27,45 @@ from pydub import AudioSegment
 from bs4 import BeautifulSoup
 import requests
 
+# lxml's C parser when installed; BeautifulSoup selects it by name
+try:
+    import lxml
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # Email processing
 import email
 from email.mime.text import MIMEText
+from email.policy import default as default_email_policy
 import imaplib
 
 from ..utils.llm_client import LLMClient
 from ..utils.logger import setup_logger
+from ..utils.serialization import loads
+from .extraction_cache import ExtractionCache
 from ..main import ProposalEvaluator, ProposalContext
 
 logger = setup_logger(__name__)
 
+# Bump whenever the extraction prompt changes, so cached results are not reused
+_EXTRACTION_PROMPT_VERSION = 1
+
+# Elements whose contents are never visible page text
+_NON_TEXT_TAGS = ["script", "style", "noscript", "template", "svg"]
+_WS_RE = re.compile(r"\s+")
+
+# Control characters other than tab/newline (PDF page breaks, form feeds, NULs)
+_CONTROL_CHARS = dict.fromkeys(c for c in range(0x20) if c not in (0x09, 0x0a))
+_INLINE_WS_RE = re.compile(r"[^\S\n]+")
+_LINE_EDGE_WS_RE = re.compile(r" ?\n ?")
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+
+# Raw text carrying both a Subject: and a From: header line, in either order
+_EMAIL_SNIFF = re.compile(r"\A(?=.*^Subject:)(?=.*^From:)", re.MULTILINE | re.DOTALL)
+# Outermost {...} span of an LLM reply wrapped in extra prose
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
 @dataclass
 class ExtractedBrief:
     """Extracted project brief information"""
@@ -68,6 +95,37 @@ class ProcessingResult:
     evaluation_id: Optional[str]
     processing_log: List[str]
 
+def _normalize_text(text: str) -> str:
+    """
+    Compact extracted document text before it is sent to the LLM
+    Drops control characters, collapses runs of spaces/tabs to one space and
+    blank-line runs to a single paragraph break
+    """
+    
+    text = _INLINE_WS_RE.sub(" ", text.translate(_CONTROL_CHARS))
+    text = _LINE_EDGE_WS_RE.sub("\n", text)
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+def _read_pdf_text(file_path: str) -> str:
+    """Extract the text of every page of a PDF (blocking; run in a thread)"""
+    
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return _normalize_text("\n".join([page.extract_text() for page in pdf_reader.pages]))
+
+def _read_docx_text(file_path: str) -> str:
+    """Extract paragraph and table text from a DOCX (blocking; run in a thread)"""
+    
+    doc = Document(file_path)
+    parts = [paragraph.text for paragraph in doc.paragraphs]
+    
+    # Extract text from tables, one line per row
+    for table in doc.tables:
+        for row in table.rows:
+            parts.append(" ".join(cell.text for cell in row.cells))
+    
+    return _normalize_text("\n".join(parts))
+
 class DocumentProcessor:
     """Handles document processing (PDF, DOCX, TXT)"""
     
@@ -78,15 +136,11 @@ class DocumentProcessor:
         """Extract text from PDF"""
         
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                
-                logger.info(f"Extracted {len(text)} characters from PDF")
-                return text.strip()
+            # PyPDF2 parsing is blocking and CPU-heavy; keep it off the event loop
+            text = await asyncio.to_thread(_read_pdf_text, file_path)
+            
+            logger.info(f"Extracted {len(text)} characters from PDF")
+            return text.strip()
                 
         except Exception as e:
             logger.error(f"PDF processing failed: {e}")
@@ -96,18 +150,7 @@ class DocumentProcessor:
         """Extract text from DOCX"""
         
         try:
-            doc = Document(file_path)
-            text = ""
-            
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
+            text = await asyncio.to_thread(_read_docx_text, file_path)
             
             logger.info(f"Extracted {len(text)} characters from DOCX")
             return text.strip()
@@ -140,16 +183,13 @@ class VoiceProcessor:
     async def process_audio(self, file_path: str) -> str:
         """Extract text from audio file"""
         
+        wav_path = file_path
         try:
             # Convert audio to WAV if needed
             wav_path = await self._convert_to_wav(file_path)
             
-            # Transcribe audio
-            with sr.AudioFile(wav_path) as source:
-                audio = self.recognizer.record(source)
-            
-            # Use Google Speech Recognition
-            text = self.recognizer.recognize_google(audio)
+            # Reading and recognition both block (the latter on a network call)
+            text = await asyncio.to_thread(self._transcribe, wav_path)
             
             logger.info(f"Transcribed {len(text)} characters from audio")
             return text
@@ -157,6 +197,20 @@ class VoiceProcessor:
         except Exception as e:
             logger.error(f"Audio processing failed: {e}")
             return ""
+        
+        finally:
+            # Remove the temporary WAV produced by the conversion
+            if wav_path != file_path:
+                Path(wav_path).unlink(missing_ok=True)
+    
+    def _transcribe(self, wav_path: str) -> str:
+        """Transcribe a WAV file (blocking; run in a thread)"""
+        
+        with sr.AudioFile(wav_path) as source:
+            audio = self.recognizer.record(source)
+        
+        # Use Google Speech Recognition
+        return self.recognizer.recognize_google(audio)
     
     async def _convert_to_wav(self, file_path: str) -> str:
         """Convert audio file to WAV format"""
@@ -166,58 +220,89 @@ class VoiceProcessor:
         if file_ext == '.wav':
             return file_path
         
+        if file_ext not in ['.mp3', '.m4a', '.ogg']:
+            logger.warning(f"Unsupported audio format: {file_ext}")
+            return file_path
+        
+        # Create temporary WAV file; process_audio deletes it after transcription
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
+            temp_wav = tmp.name
+        
         try:
-            # Create temporary WAV file
-            temp_wav = tempfile.mktemp(suffix='.wav')
-            
             # Convert using pydub
-            if file_ext in ['.mp3', '.m4a', '.ogg']:
-                audio = AudioSegment.from_file(file_path)
-                audio.export(temp_wav, format="wav")
-                return temp_wav
-            else:
-                logger.warning(f"Unsupported audio format: {file_ext}")
-                return file_path
+            await asyncio.to_thread(self._export_wav, file_path, temp_wav)
+            return temp_wav
                 
         except Exception as e:
             logger.error(f"Audio conversion failed: {e}")
+            Path(temp_wav).unlink(missing_ok=True)
             return file_path
 
+    def _export_wav(self, file_path: str, wav_path: str):
+        """Decode an audio file and write it as WAV (blocking; run in a thread)"""
+        
+        audio = AudioSegment.from_file(file_path)
+        # 16 kHz mono is all speech recognition needs and keeps the upload small
+        audio.export(wav_path, format="wav", parameters=["-ac", "1", "-ar", "16000"])
+
 class WebExtractor:
     """Handles web content extraction"""
     
-    def __init__(self, llm_client: LLMClient):
+    def __init__(self, llm_client: LLMClient, max_bytes: int = 4 * 1024 * 1024):
         self.llm_client = llm_client
+        self.max_bytes = max_bytes  # Larger pages are truncated
+        
+        # Shared HTTP session (connection pool + DNS cache), created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30, sock_read=10)
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
     async def extract_from_url(self, url: str) -> str:
         """Extract content from web URL"""
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
-                    if response.status == 200:
-                        html_content = await response.text()
-                        
-                        # Parse with BeautifulSoup
-                        soup = BeautifulSoup(html_content, 'html.parser')
-                        
-                        # Remove script and style elements
-                        for script in soup(["script", "style"]):
-                            script.decompose()
-                        
-                        # Extract text
-                        text = soup.get_text()
-                        
-                        # Clean up whitespace
-                        lines = (line.strip() for line in text.splitlines())
-                        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                        text = ' '.join(chunk for chunk in chunks if chunk)
-                        
-                        logger.info(f"Extracted {len(text)} characters from URL")
-                        return text
-                    else:
-                        logger.error(f"Failed to fetch URL: {response.status}")
-                        return ""
+            async with self._get_session().get(url) as response:
+                if response.status == 200:
+                    # Stream the body, keeping at most max_bytes of it
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(65536):
+                        body += chunk
+                        if len(body) >= self.max_bytes:
+                            logger.warning(f"Truncated {url} at {self.max_bytes} bytes")
+                            break
+                    
+                    html_content = bytes(body[:self.max_bytes]).decode(response.charset or "utf-8", errors="ignore")
+                    
+                    # Parse with BeautifulSoup
+                    soup = BeautifulSoup(html_content, HTML_PARSER)
+                    
+                    # Remove non-text elements
+                    for tag in soup(_NON_TEXT_TAGS):
+                        tag.decompose()
+                    
+                    # Extract text in one pass and collapse whitespace
+                    text = _WS_RE.sub(" ", soup.get_text(separator=" ", strip=True))
+                    
+                    logger.info(f"Extracted {len(text)} characters from URL")
+                    return text
+                else:
+                    logger.error(f"Failed to fetch URL: {response.status}")
+                    return ""
                         
         except Exception as e:
             logger.error(f"URL extraction failed: {e}")
@@ -229,23 +314,20 @@ class EmailProcessor:
     def __init__(self, llm_client: LLMClient):
         self.llm_client = llm_client
     
-    async def process_email(self, email_content: str) -> str:
-        """Process email content"""
+    async def process_email(self, email_content: Union[str, bytes]) -> str:
+        """Process email content (raw bytes preferred, as read from a .eml file)"""
         
         try:
-            # Parse email
-            msg = email.message_from_string(email_content)
+            if isinstance(email_content, str):
+                email_content = email_content.encode('utf-8')
             
-            # Extract text content
-            text_content = ""
+            # Parse email; the modern policy decodes headers and honours each
+            # part's declared charset
+            msg = email.message_from_bytes(email_content, policy=default_email_policy)
             
-            if msg.is_multipart():
-                for part in msg.walk():
-                    if part.get_content_type() == "text/plain":
-                        text_content += part.get_payload(decode=True).decode('utf-8', errors='ignore')
-            else:
-                if msg.get_content_type() == "text/plain":
-                    text_content = msg.get_payload(decode=True).decode('utf-8', errors='ignore')
+            # Extract the plain-text body
+            body = msg.get_body(preferencelist=('plain',))
+            text_content = body.get_content() if body is not None else ""
             
             # Extract headers for context
             subject = msg.get('Subject', '')
@@ -267,7 +349,10 @@ Content:
             
         except Exception as e:
             logger.error(f"Email processing failed: {e}")
-            return email_content  # Fallback to raw content
+            # Fallback to raw content
+            if isinstance(email_content, bytes):
+                return email_content.decode('utf-8', errors='ignore')
+            return email_content
 
 class AutoBriefExtractor:
     """
@@ -281,11 +366,26 @@ class AutoBriefExtractor:
         # Initialize processors
         self.document_processor = DocumentProcessor(self.llm_client)
         self.voice_processor = VoiceProcessor(self.llm_client)
-        self.web_extractor = WebExtractor(self.llm_client)
+        self.web_extractor = WebExtractor(
+            self.llm_client,
+            max_bytes=config.get("max_url_bytes", 4 * 1024 * 1024)
+        )
         self.email_processor = EmailProcessor(self.llm_client)
         
         # Initialize evaluator for auto-launch
         self.evaluator = ProposalEvaluator()
+        
+        # Caps files extracted concurrently by batch_process_directory
+        self.batch_concurrency = config.get("batch_concurrency", 8)
+        self._batch_sem = asyncio.Semaphore(self.batch_concurrency)
+        
+        # Caps the raw content inlined into the extraction prompt
+        self.max_prompt_chars = config.get("max_prompt_chars", 16000)
+        
+        # Memoized LLM extractions by content and prompt hash; opt-in via a
+        # configured database path
+        cache_path = config.get("extraction_cache_path")
+        self.extraction_cache = ExtractionCache(cache_path) if cache_path else None
     
     async def extract_from_source(
         self, 
@@ -355,6 +455,12 @@ class AutoBriefExtractor:
             logger.error(f"Auto-brief extraction failed: {e}")
             raise
     
+    async def aclose(self):
+        """Release network resources held by the processors and the cache"""
+        await self.web_extractor.aclose()
+        if self.extraction_cache is not None:
+            self.extraction_cache.close()
+    
     async def _detect_source_type(self, source: Union[str, Path]) -> str:
         """Auto-detect source type"""
         
@@ -381,7 +487,7 @@ class AutoBriefExtractor:
                 return "email"
         
         # Check if it looks like email content
-        if 'Subject:' in source_str and 'From:' in source_str:
+        if _EMAIL_SNIFF.search(source_str):
             return "email"
         
         # Default to text content
@@ -410,7 +516,7 @@ class AutoBriefExtractor:
         
         elif source_type == "email":
             if Path(source).exists():
-                with open(source, 'r') as f:
+                with open(source, 'rb') as f:
                     email_content = f.read()
             else:
                 email_content = str(source)
@@ -428,12 +534,33 @@ class AutoBriefExtractor:
     ) -> ExtractedBrief:
         """Extract structured project brief from raw content"""
         
+        cache_key = None
+        if self.extraction_cache is not None:
+            cache_key = ExtractionCache.make_key(
+                raw_content,
+                _EXTRACTION_PROMPT_VERSION,
+                source_type,
+                self.max_prompt_chars,
+                self.config.get("llm", {}).get("model")
+            )
+            cached_data = await self.extraction_cache.get(cache_key)
+            if cached_data is not None:
+                logger.info(f"Extraction cache hit for {source_location}")
+                return self._build_brief(cached_data, raw_content, source_type, source_location)
+        
+        # Keep the head and tail of long content; briefs usually state the
+        # client and goals up front and budget/timeline near the end
+        content_for_prompt = raw_content
+        if len(raw_content) > self.max_prompt_chars:
+            half = self.max_prompt_chars // 2
+            content_for_prompt = raw_content[:half] + "\n...[truncated]...\n" + raw_content[-half:]
+        
         # Build extraction prompt
         extraction_prompt = f"""Extract a structured project brief from the following content:
 
 SOURCE TYPE: {source_type}
 CONTENT:
-{raw_content}
+{content_for_prompt}
 
 Extract the following information in JSON format:
 {{
@@ -470,34 +597,20 @@ Rules:
             
             # Parse JSON response
             try:
-                extracted_data = json.loads(response)
-            except json.JSONDecodeError:
+                extracted_data = loads(response)
+            except ValueError:  # json and orjson decode errors both subclass it
                 # Try to extract JSON from response if LLM added extra text
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
+                json_match = _JSON_OBJECT.search(response)
                 if json_match:
-                    extracted_data = json.loads(json_match.group())
+                    extracted_data = loads(json_match.group())
                 else:
                     raise ValueError("Could not parse JSON from LLM response")
             
-            # Create ExtractedBrief
-            brief = ExtractedBrief(
-                source_type=source_type,
-                source_location=source_location,
-                client_name=extracted_data.get("client_name", "Unknown"),
-                project_description=extracted_data.get("project_description", ""),
-                business_context=extracted_data.get("business_context", ""),
-                objectives=extracted_data.get("objectives", []),
-                constraints=extracted_data.get("constraints", []),
-                budget_info=extracted_data.get("budget_info"),
-                timeline_info=extracted_data.get("timeline_info"),
-                stakeholders=extracted_data.get("stakeholders", []),
-                success_metrics=extracted_data.get("success_metrics", []),
-                technical_requirements=extracted_data.get("technical_requirements", []),
-                compliance_requirements=extracted_data.get("compliance_requirements", []),
-                extracted_at=datetime.utcnow(),
-                confidence_score=float(extracted_data.get("confidence_score", 0.5)),
-                raw_content=raw_content[:5000]  # Truncate for storage
-            )
+            brief = self._build_brief(extracted_data, raw_content, source_type, source_location)
+            
+            # Only successful extractions are cached; fallbacks retry next run
+            if cache_key is not None:
+                await self.extraction_cache.put(cache_key, extracted_data)
             
             return brief
             
@@ -524,6 +637,34 @@ Rules:
                 raw_content=raw_content[:5000]
             )
     
+    def _build_brief(
+        self,
+        extracted_data: Dict[str, Any],
+        raw_content: str,
+        source_type: str,
+        source_location: str
+    ) -> ExtractedBrief:
+        """Create an ExtractedBrief from the LLM's parsed JSON"""
+        
+        return ExtractedBrief(
+            source_type=source_type,
+            source_location=source_location,
+            client_name=extracted_data.get("client_name", "Unknown"),
+            project_description=extracted_data.get("project_description", ""),
+            business_context=extracted_data.get("business_context", ""),
+            objectives=extracted_data.get("objectives", []),
+            constraints=extracted_data.get("constraints", []),
+            budget_info=extracted_data.get("budget_info"),
+            timeline_info=extracted_data.get("timeline_info"),
+            stakeholders=extracted_data.get("stakeholders", []),
+            success_metrics=extracted_data.get("success_metrics", []),
+            technical_requirements=extracted_data.get("technical_requirements", []),
+            compliance_requirements=extracted_data.get("compliance_requirements", []),
+            extracted_at=datetime.utcnow(),
+            confidence_score=float(extracted_data.get("confidence_score", 0.5)),
+            raw_content=raw_content[:5000]  # Truncate for storage
+        )
+    
     async def _create_proposal_context(self, brief: ExtractedBrief) -> ProposalContext:
         """Create ProposalContext from extracted brief"""
         
@@ -556,20 +697,27 @@ Rules:
         """Process all files in a directory"""
         
         directory = Path(directory_path)
-        results = []
         
         supported_extensions = {'.pdf', '.docx', '.doc', '.txt', '.md', '.wav', '.mp3', '.m4a', '.eml'}
         
-        for file_path in directory.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
+        file_paths = [
+            file_path for file_path in directory.rglob('*')
+            if file_path.is_file() and file_path.suffix.lower() in supported_extensions
+        ]
+        
+        async def process_bounded(file_path: Path) -> Optional[ProcessingResult]:
+            async with self._batch_sem:
                 try:
                     logger.info(f"Processing: {file_path}")
-                    result = await self.extract_from_source(file_path, auto_evaluate=False)
-                    results.append(result)
+                    return await self.extract_from_source(file_path, auto_evaluate=False)
                 except Exception as e:
                     logger.error(f"Failed to process {file_path}: {e}")
+                    return None
         
-        return results
+        # Extract files concurrently, bounded by batch_concurrency; results
+        # keep the directory walk order
+        results = await asyncio.gather(*(process_bounded(file_path) for file_path in file_paths))
+        return [result for result in results if result is not None]
     
     async def generate_summary_report(self, results: List[ProcessingResult]) -> Dict[str, Any]:
         """Generate summary report from batch processing results"""
@@ -686,4 +834,7 @@ async def extract_cli(source: str, source_type: str = None, auto_evaluate: bool
         
     except Exception as e:
         print(f"❌ Extraction failed: {e}")
-        raise
\ No newline at end of file
+        raise
+    
+    finally:
+        await extractor.aclose()
\ No newline at end of file
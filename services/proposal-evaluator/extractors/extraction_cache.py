@@ -0,0 +1,71 @@
+"""
+Extraction Cache for the Auto-Brief Extractor
+=============================================
+
+SQLite-backed memo of LLM extraction results, so re-running a batch over
+unchanged documents skips their LLM round-trips.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..utils.serialization import dumps, loads
+
+class ExtractionCache:
+    """
+    Memo of parsed LLM extraction results keyed by content and prompt hash
+    Lookups and writes run in a worker thread so they never block the loop
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS extractions (key TEXT PRIMARY KEY, data_json BLOB NOT NULL)"
+        )
+    
+    @staticmethod
+    def make_key(raw_content: str, *prompt_params: Any) -> str:
+        """
+        128-bit blake2b digest of the extracted content and every parameter
+        that shapes the prompt (prompt version, truncation limit, model, ...)
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(dumps(prompt_params))
+        digest.update(b"\0")
+        digest.update(raw_content.encode("utf-8"))
+        return digest.hexdigest()
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached extraction"""
+        return await asyncio.to_thread(self._get, key)
+    
+    async def put(self, key: str, data: Dict[str, Any]) -> None:
+        """Store an extraction"""
+        await asyncio.to_thread(self._put, key, dumps(data))
+    
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data_json FROM extractions WHERE key = ?", (key,)
+            ).fetchone()
+        return loads(row[0]) if row else None
+    
+    def _put(self, key: str, data_json: bytes) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extractions (key, data_json) VALUES (?, ?)",
+                (key, data_json)
+            )
+    
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
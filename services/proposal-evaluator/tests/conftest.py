@@ -0,0 +1,17 @@
+"""
+Shared pytest setup for the proposal evaluator service
+
+The service directory name is not a valid Python identifier, so it is
+registered as the `proposal_evaluator` package for the tests to import.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+
+if "proposal_evaluator" not in sys.modules:
+    package = types.ModuleType("proposal_evaluator")
+    package.__path__ = [str(SERVICE_DIR)]
+    sys.modules["proposal_evaluator"] = package
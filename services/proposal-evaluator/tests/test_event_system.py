@@ -0,0 +1,199 @@
+"""
+Tests for the event bus and orchestrator workflow
+"""
+
+import asyncio
+
+from proposal_evaluator.core.event_system import (
+    AgentiusOrchestrator,
+    Event,
+    EventBus,
+    EventType,
+    _next_id,
+)
+
+def _judge_event(perspective: str, context_id: str, payload: dict) -> Event:
+    return Event(
+        id=_next_id(),
+        type=EventType[f"{perspective}_EVALUATION_COMPLETE"],
+        payload=payload,
+        context_id=context_id
+    )
+
+def test_judge_cache_hit_keeps_current_context_payload():
+    async def scenario():
+        bus = EventBus()
+        orchestrator = AgentiusOrchestrator(bus)
+        reached = []
+        bus.subscribe(EventType.THRESHOLD_REACHED, reached.append)
+        
+        # Context A is judged for real
+        for perspective in ("CFO", "CMO", "CEO"):
+            await orchestrator._handle_judge_evaluation_complete(_judge_event(perspective, "A", {
+                "client": "A",
+                "iteration_count": 3,
+                "proposal_text": "same proposal",
+                "perspective": perspective,
+                "score": 9.0,
+                "objections": []
+            }))
+        
+        # Context B submits identical text and is served from the cache
+        await orchestrator._handle_builder_complete(Event(
+            id=_next_id(),
+            type=EventType.BUILDER_COMPLETE,
+            payload={"client": "B", "proposal_text": "same proposal"},
+            context_id="B"
+        ))
+        return reached
+    
+    reached = asyncio.run(scenario())
+    
+    assert [event.context_id for event in reached] == ["A", "B"]
+    payload_b = reached[1].payload
+    assert payload_b["client"] == "B"
+    assert "iteration_count" not in payload_b
+    assert [evaluation["score"] for evaluation in payload_b["evaluations"]] == [9.0, 9.0, 9.0]
+    assert all(evaluation["client"] == "B" for evaluation in payload_b["evaluations"])
+
+def test_judge_cache_stores_only_verdict_fields():
+    async def scenario():
+        orchestrator = AgentiusOrchestrator(EventBus())
+        await orchestrator._handle_judge_evaluation_complete(_judge_event("CFO", "A", {
+            "client": "A",
+            "proposal_text": "text",
+            "score": 7.5,
+            "objections": ["cost"]
+        }))
+        return orchestrator._get_cached_evaluation("CFO", "text")
+    
+    assert asyncio.run(scenario()) == {"score": 7.5, "objections": ["cost"]}
+
+def test_concurrent_emits_do_not_wait_on_each_other():
+    async def scenario():
+        bus = EventBus()
+        log = []
+        a_started = asyncio.Event()
+        release_a = asyncio.Event()
+        
+        async def handler(event: Event):
+            if event.context_id == "A":
+                a_started.set()
+                await release_a.wait()
+                log.append("slow done A")
+            else:
+                log.append("fast ran B")
+        
+        bus.subscribe(EventType.PROPOSAL_SUBMITTED, handler)
+        
+        def submitted(context_id: str) -> Event:
+            return Event(id=_next_id(), type=EventType.PROPOSAL_SUBMITTED, payload={}, context_id=context_id)
+        
+        emit_a = asyncio.create_task(bus.emit(submitted("A")))
+        await a_started.wait()
+        await bus.emit(submitted("B"))
+        log.append("B emit returned")
+        release_a.set()
+        await emit_a
+        return log
+    
+    assert asyncio.run(scenario()) == ["fast ran B", "B emit returned", "slow done A"]
+
+def test_nested_emit_is_queued_until_handler_returns():
+    async def scenario():
+        bus = EventBus()
+        log = []
+        
+        async def on_submitted(event: Event):
+            await bus.emit(Event(id=_next_id(), type=EventType.BUILDER_COMPLETE, payload={}, context_id=event.context_id))
+            log.append("submitted handler done")
+        
+        async def on_builder_complete(event: Event):
+            log.append("builder handler ran")
+        
+        bus.subscribe(EventType.PROPOSAL_SUBMITTED, on_submitted)
+        bus.subscribe(EventType.BUILDER_COMPLETE, on_builder_complete)
+        await bus.emit(Event(id=_next_id(), type=EventType.PROPOSAL_SUBMITTED, payload={}, context_id="A"))
+        return log
+    
+    assert asyncio.run(scenario()) == ["submitted handler done", "builder handler ran"]
+
+def test_emit_from_task_outliving_its_handler_is_dispatched():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+        spawned = []
+        
+        async def late_emit(context_id: str):
+            await asyncio.sleep(0)
+            await bus.emit(Event(id=_next_id(), type=EventType.BUILDER_COMPLETE, payload={}, context_id=context_id))
+        
+        def on_submitted(event: Event):
+            spawned.append(asyncio.create_task(late_emit(event.context_id)))
+        
+        bus.subscribe(EventType.PROPOSAL_SUBMITTED, on_submitted)
+        bus.subscribe(EventType.BUILDER_COMPLETE, seen.append)
+        await bus.emit(Event(id=_next_id(), type=EventType.PROPOSAL_SUBMITTED, payload={}, context_id="A"))
+        await asyncio.gather(*spawned)
+        return seen
+    
+    assert [event.context_id for event in asyncio.run(scenario())] == ["A"]
+
+def test_sync_wrapped_async_handlers_are_awaited():
+    async def scenario():
+        bus = EventBus()
+        seen = []
+        
+        async def record(tag: str, event: Event):
+            await asyncio.sleep(0)
+            seen.append(tag)
+        
+        # Plain lambdas aren't coroutine functions but still return coroutines
+        bus.subscribe(EventType.PROPOSAL_SUBMITTED, lambda event: record("first", event))
+        bus.subscribe(EventType.PROPOSAL_SUBMITTED, lambda event: record("second", event))
+        bus.subscribe(EventType.BUILDER_COMPLETE, lambda event: record("lone", event))
+        await bus.emit(Event(id=_next_id(), type=EventType.PROPOSAL_SUBMITTED, payload={}, context_id="A"))
+        await bus.emit(Event(id=_next_id(), type=EventType.BUILDER_COMPLETE, payload={}, context_id="A"))
+        return seen
+    
+    assert sorted(asyncio.run(scenario())) == ["first", "lone", "second"]
+
+def test_context_bookkeeping_is_released_when_threshold_is_reached():
+    async def scenario():
+        bus = EventBus()
+        AgentiusOrchestrator(bus)
+        reached = []
+        bus.subscribe(EventType.THRESHOLD_REACHED, reached.append)
+        
+        await bus.emit(Event(id=_next_id(), type=EventType.PROPOSAL_SUBMITTED, payload={"client": "A"}, context_id="A"))
+        await bus.emit(Event(id=_next_id(), type=EventType.BUILDER_COMPLETE, payload={"proposal_text": "proposal"}, context_id="A"))
+        assert bus.task_registry
+        
+        for perspective in ("CFO", "CMO", "CEO"):
+            await bus.emit(_judge_event(perspective, "A", {
+                "proposal_text": "proposal",
+                "perspective": perspective,
+                "score": 9.0
+            }))
+        return bus, reached
+    
+    bus, reached = asyncio.run(scenario())
+    assert [event.context_id for event in reached] == ["A"]
+    assert "A" not in bus.active_contexts
+    assert "A" not in bus._context_events
+    assert "A" not in bus._context_event_ids
+    assert "A" not in bus._tasks_by_context
+    assert not bus.task_registry
+    assert not bus._waiters
+
+def test_task_without_a_started_event_fails_with_unknown_type():
+    async def scenario():
+        bus = EventBus()
+        AgentiusOrchestrator(bus)
+        await bus.emit(Event(id=_next_id(), type=EventType.PROPOSAL_SUBMITTED, payload={"client": "A"}, context_id="A"))
+        return bus.task_registry["builder_A"]
+    
+    task = asyncio.run(scenario())
+    assert task.status == "failed"
+    assert task.error == "Unknown task type: build_proposal"
+    assert task.completed_at is not None
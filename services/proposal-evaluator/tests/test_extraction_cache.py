@@ -0,0 +1,61 @@
+"""
+Tests for the auto-brief extraction cache
+"""
+
+import asyncio
+
+from proposal_evaluator.extractors.extraction_cache import ExtractionCache
+
+def test_round_trip_survives_reopen(tmp_path):
+    db_path = str(tmp_path / "cache" / "briefs.db")
+    key = ExtractionCache.make_key("brief text", 1, "pdf", 16000, "gpt-4")
+    
+    async def scenario():
+        cache = ExtractionCache(db_path)
+        assert await cache.get(key) is None
+        await cache.put(key, {"client_name": "Acme", "objectives": ["grow"]})
+        cache.close()
+        
+        reopened = ExtractionCache(db_path)
+        try:
+            return await reopened.get(key)
+        finally:
+            reopened.close()
+    
+    assert asyncio.run(scenario()) == {"client_name": "Acme", "objectives": ["grow"]}
+
+def test_key_depends_on_prompt_parameters():
+    base = ExtractionCache.make_key("brief text", 1, "pdf", 16000, "gpt-4")
+    
+    assert base == ExtractionCache.make_key("brief text", 1, "pdf", 16000, "gpt-4")
+    assert base != ExtractionCache.make_key("brief text", 2, "pdf", 16000, "gpt-4")
+    assert base != ExtractionCache.make_key("brief text", 1, "pdf", 8000, "gpt-4")
+    assert base != ExtractionCache.make_key("brief text", 1, "pdf", 16000, "gpt-4o")
+    assert base != ExtractionCache.make_key("other text", 1, "pdf", 16000, "gpt-4")
+
+def test_lookups_do_not_block_the_event_loop(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "briefs.db"))
+    
+    async def scenario():
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+        
+        ticking = asyncio.create_task(ticker())
+        with cache._lock:
+            # Held lock: a lookup waits in its worker thread while the loop runs
+            lookup = asyncio.create_task(cache.get("missing"))
+            await asyncio.sleep(0.05)
+            assert not lookup.done()
+        result = await lookup
+        ticking.cancel()
+        return ticks, result
+    
+    ticks, result = asyncio.run(scenario())
+    cache.close()
+    assert result is None
+    assert ticks > 1
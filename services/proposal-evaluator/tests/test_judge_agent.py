@@ -0,0 +1,41 @@
+"""
+Tests for the shared cap on concurrent judge calls
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+
+from proposal_evaluator.agents.judge_agent import DEFAULT_MAX_PARALLEL_JUDGES, JudgeAgent, set_max_parallel_judges
+
+def test_perspective_evaluations_respect_the_parallel_judge_cap():
+    agent = JudgeAgent({"llm": {"provider": "anthropic"}, "max_parallel_judges": 2})
+    in_flight = 0
+    peak = 0
+    
+    async def evaluate(proposal, context, perspective):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return type("Evaluation", (), {"score": 7.0})()
+    
+    agent.evaluate = evaluate
+    
+    async def scenario():
+        # Two proposals at once: six perspective calls against two slots
+        return await asyncio.gather(
+            agent.evaluate_all_perspectives("proposal 1", None),
+            agent.evaluate_all_perspectives("proposal 2", None)
+        )
+    
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        set_max_parallel_judges(DEFAULT_MAX_PARALLEL_JUDGES)
+    assert [len(evaluations) for evaluations in results] == [3, 3]
+    assert peak == 2
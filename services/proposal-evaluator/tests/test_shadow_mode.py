@@ -0,0 +1,126 @@
+"""
+Tests for the shadow-mode observation window and its NDJSON log
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+
+from proposal_evaluator.agents.judge_agent import DEFAULT_MAX_PARALLEL_JUDGES, set_max_parallel_judges
+from proposal_evaluator.core.shadow_mode import ShadowModeProcessor
+
+class _FakeJudge:
+    def __init__(self, archetype: str):
+        self.archetype = archetype
+    
+    async def evaluate(self, proposal_text, context, iteration=1):
+        return SimpleNamespace(
+            score=8.0,
+            confidence=0.9,
+            objections=["budget"],
+            suggestions=["phase it"],
+            strengths=["clear scope"],
+            concerns=["timeline"]
+        )
+
+class _FakeJudgeFactory:
+    def create_judge(self, archetype, config):
+        return _FakeJudge(archetype)
+
+def _processor(path, **config) -> ShadowModeProcessor:
+    processor = ShadowModeProcessor({"shadow_data_path": str(path), "judge_cache_enabled": False, **config})
+    processor.judge_factory = _FakeJudgeFactory()
+    return processor
+
+def test_outcome_for_evicted_observation_is_recorded(tmp_path):
+    async def scenario():
+        processor = _processor(tmp_path, shadow_mem_limit=3)
+        ids = [await processor.observe_proposal(f"proposal {i}", {"client": "Acme"}) for i in range(5)]
+        assert ids[0] not in processor._row_by_id
+        
+        await processor.record_human_outcome(ids[0], "approved", "looks good")
+        await processor.aclose()
+        
+        reloaded = _processor(tmp_path)
+        observation = reloaded._obs_by_id[ids[0]]
+        await reloaded.aclose()
+        return observation
+    
+    observation = asyncio.run(scenario())
+    assert observation.human_outcome == "approved"
+    assert observation.human_feedback == "looks good"
+    assert observation.accuracy_score is not None
+
+def test_replay_skips_day_logs_before_since(tmp_path):
+    async def observe(texts):
+        processor = _processor(tmp_path)
+        for text in texts:
+            await processor.observe_proposal(text, {"client": "Acme"})
+        await processor.aclose()
+    
+    asyncio.run(observe(["old proposal 1", "old proposal 2"]))
+    (log_path,) = tmp_path.glob("events_*.ndjson")
+    log_path.rename(tmp_path / "events_2000-01-01.ndjson")
+    asyncio.run(observe(["new proposal"]))
+    
+    processor = _processor(tmp_path)
+    since = datetime.utcnow() - timedelta(days=1)
+    recent = [obs.proposal_text for obs in processor._replay_log(since)]
+    everything = [obs.proposal_text for obs in processor._replay_log()]
+    asyncio.run(processor.aclose())
+    
+    assert recent == ["new proposal"]
+    assert everything == ["old proposal 1", "old proposal 2", "new proposal"]
+
+def test_eviction_trims_columns_in_batches(tmp_path):
+    async def scenario():
+        processor = _processor(tmp_path, shadow_mem_limit=4)
+        for i in range(11):
+            observation_id = await processor.observe_proposal(f"proposal {i}", {"client": "Acme"})
+            await processor.record_human_outcome(observation_id, "approved" if i % 2 else "rejected")
+            assert len(processor._cols["acc"]) < 2 * 4
+        
+        running = processor._running_metrics()
+        snapshot = processor._snapshot_cols()
+        await processor.aclose()
+        
+        reloaded = _processor(tmp_path, shadow_mem_limit=4)
+        reloaded_snapshot = reloaded._snapshot_cols()
+        await reloaded.aclose()
+        return processor, running, snapshot, reloaded_snapshot
+    
+    processor, running, snapshot, reloaded_snapshot = asyncio.run(scenario())
+    assert processor._row_base == 7
+    assert snapshot["human"] == [obs.human_outcome for obs in processor.observations]
+    assert snapshot["ts"] == reloaded_snapshot["ts"]
+    assert running.prediction_accuracy == pytest.approx(sum(snapshot["acc"]) / len(snapshot["acc"]))
+
+def test_shadow_judges_respect_the_parallel_judge_cap(tmp_path):
+    in_flight = 0
+    peak = 0
+    
+    class _SlowJudge(_FakeJudge):
+        async def evaluate(self, proposal_text, context, iteration=1):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await super().evaluate(proposal_text, context, iteration)
+    
+    async def scenario():
+        processor = _processor(tmp_path, max_parallel_judges=2)
+        processor.judge_factory = SimpleNamespace(create_judge=lambda archetype, config: _SlowJudge(archetype))
+        await asyncio.gather(*(processor.observe_proposal(f"proposal {i}", {"client": "Acme"}) for i in range(3)))
+        await processor.aclose()
+    
+    try:
+        asyncio.run(scenario())
+    finally:
+        set_max_parallel_judges(DEFAULT_MAX_PARALLEL_JUDGES)
+    assert peak == 2
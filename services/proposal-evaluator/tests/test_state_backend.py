@@ -0,0 +1,70 @@
+"""
+Tests for event/task persistence through the state backends
+"""
+
+import asyncio
+from datetime import datetime
+
+from proposal_evaluator.core.event_system import Event, EventBus, EventType, TaskRegistration, _next_id
+from proposal_evaluator.core.state_backend import InMemoryBackend, SQLiteBackend
+
+def _event(event_type: EventType, context_id: str, payload: dict) -> Event:
+    return Event(id=_next_id(), type=event_type, payload=payload, context_id=context_id)
+
+def test_sqlite_backend_persists_snapshots_taken_at_emit(tmp_path):
+    async def scenario():
+        bus = EventBus(backend=SQLiteBackend(str(tmp_path / "state.db")))
+        
+        payload = {"client": "A", "score": 7}
+        await bus.emit(_event(EventType.PROPOSAL_SUBMITTED, "A", payload))
+        payload["score"] = 9  # changed after the emit was queued
+        
+        task = TaskRegistration(
+            id="builder_A",
+            context_id="A",
+            task_type="build_proposal",
+            status="pending",
+            agent_id="builder_agent",
+            depends_on=["missing"],
+            payload={"client": "A"},
+            created_at=datetime(2026, 1, 1)
+        )
+        await bus.register_task(task)
+        task.status = "complete"
+        task.payload["client"] = "B"
+        
+        await bus.emit(_event(EventType.EVALUATION_COMPLETE, "A", {"final_score": 9}))
+        await bus.aclose()
+        
+        reopened = SQLiteBackend(str(tmp_path / "state.db"))
+        events, tasks = reopened.load_context("A")
+        reopened.close()
+        return events, tasks
+    
+    events, tasks = asyncio.run(scenario())
+    
+    assert [event.type for event in events] == [EventType.PROPOSAL_SUBMITTED, EventType.EVALUATION_COMPLETE]
+    assert events[0].payload == {"client": "A", "score": 7}
+    assert [(task.status, task.payload) for task in tasks] == [("pending", {"client": "A"})]
+
+def test_released_context_event_chain_is_read_from_backend():
+    async def scenario():
+        bus = EventBus(backend=InMemoryBackend())
+        await bus.emit(_event(EventType.PROPOSAL_SUBMITTED, "A", {}))
+        await bus.emit(_event(EventType.EVALUATION_FAILED, "A", {"error": "boom"}))
+        assert "A" not in bus.active_contexts
+        
+        chain = await bus.get_event_chain("A")
+        await bus.aclose()
+        return chain
+    
+    chain = asyncio.run(scenario())
+    assert [event.type for event in chain] == [EventType.PROPOSAL_SUBMITTED, EventType.EVALUATION_FAILED]
+
+def test_in_memory_backend_evicts_oldest_context():
+    backend = InMemoryBackend(max_contexts=2)
+    for context_id in ("A", "B", "C"):
+        backend.append_event(_event(EventType.PROPOSAL_SUBMITTED, context_id, {}))
+    
+    assert backend.load_context("A") == ([], [])
+    assert len(backend.load_context("C")[0]) == 1
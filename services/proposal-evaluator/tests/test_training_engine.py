@@ -0,0 +1,138 @@
+"""
+Tests for training data storage and the stored-example count
+"""
+
+import asyncio
+import fcntl
+import json
+import threading
+import time
+
+import pytest
+
+from proposal_evaluator.core.training_engine import ModelRetrainingOrchestrator, TrainingExample
+
+def _example(prompt: str, outcome_quality: str = "good", archetype: str = "conservative_cfo") -> TrainingExample:
+    return TrainingExample(
+        input_prompt=prompt,
+        expected_output="output",
+        context={"client": "Acme"},
+        performance_score=2.0,
+        archetype=archetype,
+        fear_triggers=[],
+        outcome_quality=outcome_quality,
+        feedback_source="score_improvement"
+    )
+
+def _read_prompts(path) -> list:
+    with open(path) as f:
+        return [json.loads(line)["input_prompt"] for line in f]
+
+def test_count_read_waits_off_the_event_loop(tmp_path):
+    orchestrator = ModelRetrainingOrchestrator({"training_data_path": str(tmp_path)})
+    counts_path = tmp_path / "counts.json"
+    counts_path.write_text(json.dumps({"total_examples": 42}))
+    locked = threading.Event()
+    
+    def hold_exclusive_lock():
+        # A writer (recount or shard append) holding the lock for a while
+        with open(counts_path) as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            locked.set()
+            time.sleep(0.2)
+    
+    async def scenario():
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+        
+        writer = threading.Thread(target=hold_exclusive_lock)
+        writer.start()
+        await asyncio.to_thread(locked.wait)
+        
+        ticking = asyncio.create_task(ticker())
+        total = await orchestrator._count_stored_examples()
+        ticking.cancel()
+        writer.join()
+        return ticks, total
+    
+    ticks, total = asyncio.run(scenario())
+    assert total == 42
+    assert ticks > 10  # the loop kept running while the read waited
+
+def test_prepare_retraining_dataset_merges_files_once(tmp_path):
+    orchestrator = ModelRetrainingOrchestrator({"training_data_path": str(tmp_path)})
+    
+    # A daily shard and a consolidated file from an earlier run overlap
+    orchestrator._write_examples(tmp_path / "conservative_cfo_20260101.jsonl", [_example("a"), _example("b", "poor")])
+    orchestrator._write_examples(tmp_path / "consolidated_high_quality.jsonl", [_example("a"), _example("c")])
+    
+    asyncio.run(orchestrator._prepare_retraining_dataset())
+    
+    assert sorted(_read_prompts(tmp_path / "consolidated_high_quality.jsonl")) == ["a", "c"]
+    assert _read_prompts(tmp_path / "consolidated_refinement.jsonl") == []
+
+def test_retraining_requests_coalesce_while_a_run_is_in_flight(tmp_path):
+    orchestrator = ModelRetrainingOrchestrator({"training_data_path": str(tmp_path)})
+    runs = []
+    
+    async def fake_retraining():
+        runs.append("start")
+        await asyncio.sleep(0.01)
+    
+    orchestrator._trigger_retraining = fake_retraining
+    
+    async def scenario():
+        first = orchestrator.request_retraining()
+        second = orchestrator.request_retraining()
+        await first
+        third = orchestrator.request_retraining()
+        await third
+        return first is second, first is third
+    
+    assert asyncio.run(scenario()) == (True, False)
+    assert runs == ["start", "start"]
+
+def test_stored_examples_are_deduplicated_across_instances(tmp_path):
+    orchestrator = ModelRetrainingOrchestrator({"training_data_path": str(tmp_path)})
+    asyncio.run(orchestrator._store_training_examples([_example("a"), _example("a"), _example("b")]))
+    asyncio.run(orchestrator._store_training_examples([_example("b")]))
+    
+    # Fingerprints persist, so a restarted orchestrator still skips repeats
+    restarted = ModelRetrainingOrchestrator({"training_data_path": str(tmp_path)})
+    asyncio.run(restarted._store_training_examples([_example("a"), _example("c")]))
+    
+    (shard,) = tmp_path.glob("conservative_cfo_*.jsonl")
+    assert _read_prompts(shard) == ["a", "b", "c"]
+    assert asyncio.run(restarted._count_stored_examples()) == 3
+
+def test_failed_shard_write_does_not_mark_examples_as_stored(tmp_path):
+    orchestrator = ModelRetrainingOrchestrator({"training_data_path": str(tmp_path)})
+    write = orchestrator._write_and_count_examples
+    
+    def failing_write(file_path, examples):
+        if file_path.name.startswith("growth_cmo_"):
+            raise OSError("disk full")
+        write(file_path, examples)
+    
+    orchestrator._write_and_count_examples = failing_write
+    batch = [_example("a"), _example("b", archetype="growth_cmo")]
+    with pytest.raises(OSError):
+        asyncio.run(orchestrator._store_training_examples(batch))
+    
+    # The failed archetype can be retried in the same process
+    orchestrator._write_and_count_examples = write
+    asyncio.run(orchestrator._store_training_examples(batch))
+    
+    # And the written shard's fingerprints were persisted before the failure
+    restarted = ModelRetrainingOrchestrator({"training_data_path": str(tmp_path)})
+    asyncio.run(restarted._store_training_examples(batch))
+    
+    (cfo_shard,) = tmp_path.glob("conservative_cfo_*.jsonl")
+    (cmo_shard,) = tmp_path.glob("growth_cmo_*.jsonl")
+    assert _read_prompts(cfo_shard) == ["a"]
+    assert _read_prompts(cmo_shard) == ["b"]
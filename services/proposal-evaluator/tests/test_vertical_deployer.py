@@ -0,0 +1,178 @@
+"""
+Tests for content-addressed vertical image builds
+"""
+
+import asyncio
+import socket
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from proposal_evaluator.deployment.vertical_deployer import (
+    ContainerizedDeployer,
+    DeploymentSpec,
+    _build_context_digest,
+    global_vertical_configs,
+)
+
+FILES = {"Dockerfile": "FROM agentius/proposal-evaluator:latest\n", "config.json": "{}"}
+
+def test_build_context_digest_is_stable_for_same_inputs():
+    assert _build_context_digest(dict(reversed(list(FILES.items()))), "sha256:a") == _build_context_digest(FILES, "sha256:a")
+
+def test_build_context_digest_changes_when_base_image_moves():
+    assert _build_context_digest(FILES, "sha256:a") != _build_context_digest(FILES, "sha256:b")
+
+def test_build_context_digest_changes_with_file_contents():
+    assert _build_context_digest(FILES, "sha256:a") != _build_context_digest({**FILES, "config.json": "{\"a\": 1}"}, "sha256:a")
+
+class _FakeImages:
+    """Registry and local store that only know the base image"""
+    
+    def __init__(self, errors, base_id: str):
+        self.errors = errors
+        self.base_id = base_id
+        self.built = []
+    
+    def get_registry_data(self, tag: str):
+        if tag.endswith("proposal-evaluator:latest"):
+            return SimpleNamespace(id=self.base_id)
+        raise self.errors.APIError("not in registry")
+    
+    def get(self, tag: str):
+        raise self.errors.ImageNotFound("not local")
+    
+    def build(self, **kwargs):
+        self.built.append(kwargs)
+        return SimpleNamespace(tag=lambda *args: None), []
+    
+    def push(self, tag: str):
+        pass
+
+def _make_deployer(monkeypatch, client, **config) -> ContainerizedDeployer:
+    docker = pytest.importorskip("docker")
+    monkeypatch.setattr(docker, "from_env", lambda: client)
+    return ContainerizedDeployer(config)
+
+def test_moved_base_image_forces_rebuild(monkeypatch):
+    docker = pytest.importorskip("docker")
+    images = _FakeImages(docker.errors, "sha256:base-1")
+    deployer = _make_deployer(monkeypatch, SimpleNamespace(images=images))
+    vertical_config = global_vertical_configs.get_vertical_config(
+        global_vertical_configs.list_available_verticals()[0]
+    )
+    
+    asyncio.run(deployer._build_vertical_image(vertical_config, "deployment-1", push=False))
+    images.base_id = "sha256:base-2"
+    asyncio.run(deployer._build_vertical_image(vertical_config, "deployment-2", push=False))
+    
+    first, second = images.built
+    assert first["tag"] != second["tag"]
+    assert first["pull"] and second["pull"]
+
+def _free_port_range(size: int) -> tuple:
+    """A run of ports that can currently be bound"""
+    for start in range(20000, 30000, size):
+        ports = range(start, start + size)
+        sockets = []
+        try:
+            for port in ports:
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sockets.append(s)
+                s.bind(("", port))
+        except OSError:
+            continue
+        finally:
+            for s in sockets:
+                s.close()
+        return start, start + size
+    pytest.skip("no free port range")
+
+def test_ports_are_unique_and_released_on_failed_deploy(monkeypatch):
+    deployer = _make_deployer(monkeypatch, SimpleNamespace(api=None), port_range=_free_port_range(2))
+    
+    first = deployer._get_available_port("deployment-1")
+    second = deployer._get_available_port("deployment-2")
+    assert first != second
+    assert deployer._get_available_port("deployment-1") == first
+    with pytest.raises(RuntimeError):
+        deployer._get_available_port("deployment-3")
+    
+    # The fake client has no API, so cleanup fails but still frees the port
+    asyncio.run(deployer._cleanup_failed_deployment("deployment-1"))
+    assert deployer._get_available_port("deployment-3") == first
+
+def test_failed_setup_cancels_siblings_before_cleanup(monkeypatch):
+    deployer = _make_deployer(monkeypatch, SimpleNamespace(api=None))
+    events = []
+    
+    async def build_image(*args, **kwargs):
+        return "image:tag"
+    
+    async def deploy_container(*args):
+        return SimpleNamespace(id="container-1")
+    
+    async def setup_networking(*args):
+        await asyncio.sleep(0)
+        raise RuntimeError("network down")
+    
+    async def slow_step(*args):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+    
+    async def cleanup(deployment_id):
+        events.append("cleanup")
+    
+    monkeypatch.setattr(deployer, "_build_vertical_image", build_image)
+    monkeypatch.setattr(deployer, "_deploy_container", deploy_container)
+    monkeypatch.setattr(deployer, "_setup_networking", setup_networking)
+    monkeypatch.setattr(deployer, "_setup_monitoring", slow_step)
+    monkeypatch.setattr(deployer, "_perform_health_checks", slow_step)
+    monkeypatch.setattr(deployer, "_cleanup_failed_deployment", cleanup)
+    
+    vertical = global_vertical_configs.list_available_verticals()[0]
+    with pytest.raises(RuntimeError, match="network down"):
+        asyncio.run(deployer.deploy_vertical_instance(vertical, "client-1", environment="dev"))
+    assert events == ["cancelled", "cancelled", "cleanup"]
+
+def test_container_run_stays_off_the_event_loop(monkeypatch):
+    def run(**config):
+        # Container create + start: a blocking Docker API round trip
+        time.sleep(0.2)
+        return SimpleNamespace(id=config["name"])
+    
+    client = SimpleNamespace(containers=SimpleNamespace(run=run))
+    deployer = _make_deployer(monkeypatch, client, port_range=_free_port_range(1))
+    spec = DeploymentSpec(
+        deployment_id="deployment-1",
+        vertical="education",
+        client_id="client-1",
+        environment="dev",
+        resources=deployer._get_resource_spec("dev"),
+        networking=deployer._get_networking_spec("deployment-1"),
+        storage=deployer._get_storage_spec("deployment-1"),
+        scaling=deployer._get_scaling_spec("dev"),
+        monitoring=deployer._get_monitoring_spec("deployment-1")
+    )
+    
+    async def scenario():
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+        
+        ticking = asyncio.create_task(ticker())
+        container = await deployer._deploy_container(spec, "image:tag")
+        ticking.cancel()
+        return container, ticks
+    
+    container, ticks = asyncio.run(scenario())
+    assert container.id == "deployment-1"
+    assert ticks > 5  # the loop kept running during the create
@@ -0,0 +1,64 @@
+"""
+JSON serialization utilities for the proposal evaluator service
+"""
+
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for types neither backend handles natively"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        # Shallow: the encoder recurses into the field values itself, so
+        # there is no need for asdict()'s deep copy of nested containers
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes
+    
+    Uses orjson when installed (dataclasses, datetimes and numpy arrays are
+    handled natively), otherwise the stdlib json module.
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+    
+    Returns:
+        JSON document as bytes
+    """
+    
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    
+    return json.dumps(obj, default=_default, indent=2 if indent else None).encode()
+
+def loads(data: Any) -> Any:
+    """
+    Parse a JSON document
+    
+    Args:
+        data: JSON as bytes or str
+    
+    Returns:
+        Parsed object
+    """
+    
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)